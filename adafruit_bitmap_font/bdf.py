@@ -31,14 +31,182 @@ except ImportError:
     pass
 
 import gc
+from array import array
 
 from fontio import Glyph
 
-from .glyph_cache import GlyphCache
+from .glyph_cache import CodePointRanges, GlyphCache, _to_code_points
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
 
+# Lines scanned between yields when loading asynchronously
+_LINES_PER_STEP = 256
+# Bytes read from the file at a time
+_BLOCK_SIZE = 512
+
+# Tokens for the keywords that matter when loading glyphs
+_OTHER = 0
+_STARTCHAR = 1
+_ENCODING = 2
+_DWIDTH = 3
+_BBX = 4
+_BITMAP = 5
+_ENDCHAR = 6
+_SIZE = 7
+_CHARS = 8
+
+# Keywords by their first byte, so that most lines need a single comparison. Bitmap rows
+# never match because every keyword has a letter after its first that isn't a hex digit.
+_KEYWORDS = {
+    ord("B"): ((b"BBX", _BBX), (b"BITMAP", _BITMAP)),
+    ord("C"): ((b"CHARS ", _CHARS),),
+    ord("D"): ((b"DWIDTH", _DWIDTH),),
+    ord("E"): ((b"ENCODING", _ENCODING), (b"ENDCHAR", _ENDCHAR)),
+    ord("S"): ((b"STARTCHAR", _STARTCHAR), (b"SIZE", _SIZE)),
+}
+
+# Value of each hex digit by ASCII code
+_HEX_DIGITS = bytearray(256)
+for _i, _c in enumerate(b"0123456789ABCDEF"):
+    _HEX_DIGITS[_c] = _i
+    # Lower case letters
+    _HEX_DIGITS[_c | 0x20] = _i
+
+
+def _parse_ints(block: bytes, start: int, end: int, values: list) -> int:
+    """Parses the integers in ``block[start:end]`` into ``values`` without allocating.
+    Returns how many were found."""
+    count = 0
+    value = 0
+    sign = 1
+    digits = False
+    for i in range(start, end):
+        char = block[i]
+        if 48 <= char <= 57:
+            value = value * 10 + char - 48
+            digits = True
+        elif char == 45:
+            sign = -1
+        else:
+            if digits and count < len(values):
+                values[count] = sign * value
+                count += 1
+            value = 0
+            sign = 1
+            digits = False
+    if digits and count < len(values):
+        values[count] = sign * value
+        count += 1
+    return count
+
+
+class _LineReader:
+    """Reads a file line by line in large blocks. After `readline` the line, without its line
+    ending, is ``block[start:end]``.
+
+    Files are read into one bytearray that is reused for every block. A font held in memory
+    as ``bytes`` or ``bytearray``, or a memoryview of all of one, is used as the block itself
+    and never read."""
+
+    def __init__(self, file: FileIO) -> None:
+        self.file = file
+        whole = getattr(file, "buffer", None)
+        if isinstance(whole, memoryview):
+            # Views have no find, so use the object they show. MicroPython views don't tell.
+            obj = getattr(whole, "obj", None)
+            whole = obj if obj is not None and len(obj) == whole.nbytes else None
+        if isinstance(whole, (bytes, bytearray)):
+            self._whole = whole
+            self.block = whole
+            self._length = len(whole)
+        else:
+            self._whole = None
+            self.block = bytearray(_BLOCK_SIZE)
+            self._view = memoryview(self.block)
+            self._length = 0
+        self.start = 0
+        self.end = 0
+        # Index in block of the next line and the file offset of block[0]
+        self._next = 0
+        self._offset = 0
+
+    def seek(self, offset: int) -> None:
+        """Moves to ``offset`` in the file, reusing the current block when it is in it"""
+        if self._whole is not None:
+            self._next = offset
+        elif self._offset <= offset <= self._offset + self._length:
+            self._next = offset - self._offset
+        else:
+            self._length = 0
+            self._next = 0
+            self._offset = offset
+
+    def tell(self) -> int:
+        """The file offset of the next line"""
+        return self._offset + self._next
+
+    def line_offset(self) -> int:
+        """The file offset of the current line"""
+        return self._offset + self.start
+
+    def _refill(self) -> bool:
+        """Moves the unread end of the block to its start and fills the rest from the file.
+        Returns False at the end of the file."""
+        if self._whole is not None:
+            return False
+        tail = self._length - self._next
+        if tail == len(self.block):
+            # A line longer than the block
+            block = bytearray(2 * len(self.block))
+            block[:tail] = self._view
+            self.block = block
+            self._view = memoryview(block)
+        elif self._next:
+            self._view[:tail] = self._view[self._next : self._length]
+        self._offset += self._next
+        self._next = 0
+        self._length = tail
+        # Other code may have moved the file position so always seek first
+        self.file.seek(self._offset + tail)
+        count = self.file.readinto(self._view[tail:]) or 0
+        self._length += count
+        return count > 0
+
+    def readline(self) -> bool:
+        """Moves to the next line. Returns False at the end of the file."""
+        newline = self.block.find(b"\n", self._next, self._length)
+        while newline < 0:
+            searched = self._length - self._next
+            if not self._refill():
+                if self._next >= self._length:
+                    return False
+                newline = self._length
+                break
+            newline = self.block.find(b"\n", searched, self._length)
+        block = self.block
+        start = self.start = self._next
+        end = newline
+        if end > start and block[end - 1] == 13:
+            end -= 1
+        self.end = end
+        self._next = min(newline + 1, self._length)
+        return True
+
+    def token(self) -> int:
+        """The keyword token of the current line"""
+        if self.start == self.end:
+            return _OTHER
+        block = self.block
+        for keyword, token in _KEYWORDS.get(block[self.start], ()):
+            if block.startswith(keyword, self.start):
+                return token
+        return _OTHER
+
+    def startswith(self, prefix: bytes) -> bool:
+        """Whether the current line starts with ``prefix``"""
+        return self.block.startswith(prefix, self.start)
+
 
 class BDF(GlyphCache):
     """Loads glyphs from a BDF file in the given bitmap_class."""
@@ -49,8 +217,10 @@ class BDF(GlyphCache):
         self.name = f
         self.file.seek(0)
         self.bitmap_class = bitmap_class
-        line = self._readline_file()
-        if not line or not line.startswith("STARTFONT 2.1"):
+        self._reader = _LineReader(f)
+        # Reused for the integers parsed from each line
+        self._values = [0, 0, 0, 0]
+        if not self._reader.readline() or not self._reader.startswith(b"STARTFONT 2.1"):
             raise ValueError("Unsupported file version")
         self._verify_bounding_box()
         self.point_size = None
@@ -58,55 +228,65 @@ class BDF(GlyphCache):
         self.y_resolution = None
         self._ascent = None
         self._descent = None
+        # Where the next scan for glyphs resumes and the STARTCHAR offset of every glyph
+        # passed so far, so the file is only scanned once
+        self._scan_offset = 0
+        self._scan_complete = False
+        self._index_code_points = array("I")
+        self._index_offsets = array("I")
+        self._index_map = None
 
     @property
     def descent(self) -> Optional[int]:
         """The number of pixels below the baseline of a typical descender"""
         if self._descent is None:
-            self.file.seek(0)
-            while True:
-                line = self.file.readline()
-                if not line:
-                    break
-
-                if line.startswith(b"FONT_DESCENT "):
-                    self._descent = int(line.split()[1])
-                    break
-
+            self._descent = self._read_property(b"FONT_DESCENT ")
         return self._descent
 
     @property
     def ascent(self) -> Optional[int]:
         """The number of pixels above the baseline of a typical ascender"""
         if self._ascent is None:
-            self.file.seek(0)
-            while True:
-                line = self._readline_file()
-                if not line:
-                    break
-
-                if line.startswith("FONT_ASCENT "):
-                    self._ascent = int(line.split()[1])
-                    break
-
+            self._ascent = self._read_property(b"FONT_ASCENT ")
         return self._ascent
 
+    def _read_property(self, keyword: bytes) -> Optional[int]:
+        """Finds the integer value of ``keyword`` in the font header"""
+        reader = self._reader
+        reader.seek(0)
+        while reader.readline():
+            if reader.startswith(keyword):
+                _parse_ints(reader.block, reader.start + len(keyword), reader.end, self._values)
+                return self._values[0]
+            if reader.token() == _CHARS:
+                break
+        return None
+
     def _verify_bounding_box(self) -> None:
         """Private function to verify FOUNTBOUNDINGBOX parameter
-        This function will parse the first 10 lines of the font source
-        file to verify the value or raise an exception in case is not found
+        This function will parse the font header to verify the value or raise an exception
+        in case is not found
         """
-        self.file.seek(0)
-        # Normally information about the FONT is in the first four lines.
-        # Exception is when font file have a comment. Comments are three lines
-        # 10 lines is a safe bet
-        for _ in range(11):
-            line = self._readline_file()
-            while line.startswith("COMMENT "):
-                line = self._readline_file()
-            if line.startswith("FONTBOUNDINGBOX "):
-                _, x, y, x_offset, y_offset = line.split()
-                self._boundingbox = (int(x), int(y), int(x_offset), int(y_offset))
+        reader = self._reader
+        values = self._values
+        monospaced = False
+        reader.seek(0)
+        while reader.readline():
+            if reader.startswith(b"FONTBOUNDINGBOX "):
+                _parse_ints(reader.block, reader.start + 16, reader.end, values)
+                self._boundingbox = (values[0], values[1], values[2], values[3])
+            elif reader.startswith(b'SPACING "M"') or reader.startswith(b'SPACING "C"'):
+                monospaced = True
+            elif reader.token() == _CHARS:
+                break
+
+        # Every glyph of a monospaced or character cell font has the advance of the first
+        if monospaced:
+            while reader.readline():
+                if reader.token() == _DWIDTH:
+                    _parse_ints(reader.block, reader.start + 6, reader.end, values)
+                    self.fixed_advance = values[0]
+                    break
 
         try:
             self._boundingbox
@@ -115,121 +295,196 @@ class BDF(GlyphCache):
                 "Source file does not have the FOUNTBOUNDINGBOX parameter"
             ) from error
 
-    def _readline_file(self) -> str:
-        line = self.file.readline()
-        return str(line, "utf-8")
-
     def get_bounding_box(self) -> Tuple[int, int, int, int]:
         """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
         return self._boundingbox
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
-        metadata = True
-        character = False
-        code_point = None
-        bytes_per_row = 1
-        desired_character = False
-        current_info = {}
-        current_y = 0
-        rounded_x = 1
-        if isinstance(code_points, int):
-            remaining = set()
-            remaining.add(code_points)
-        elif isinstance(code_points, str):
-            remaining = set(ord(c) for c in code_points)
-        elif isinstance(code_points, set):
+        for _ in self._load_steps(code_points, 0):
+            pass
+
+    def load_metrics(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        for _ in self._load_steps(code_points, 0, True):
+            pass
+
+    def _load_steps(
+        self,
+        code_points: Union[int, str, Iterable[int]],
+        chunk_size: int,
+        metrics_only: bool = False,
+    ):
+        """Loads the given code points. When ``chunk_size`` is not zero this yields after
+        every ``chunk_size`` glyphs and every ``_LINES_PER_STEP`` lines scanned."""
+        if isinstance(code_points, set):
             remaining = code_points
         else:
-            remaining = set(code_points)
+            remaining = set(_to_code_points(code_points))
         for code_point in remaining.copy():
             if code_point in self._glyphs and self._glyphs[code_point]:
                 remaining.remove(code_point)
+            elif metrics_only and self._metrics.get(code_point):
+                remaining.remove(code_point)
+            elif code_point in self._missing:
+                remaining.remove(code_point)
         if not remaining:
             return
 
-        x, _, _, _ = self._boundingbox
+        # Glyphs whose records were passed by an earlier scan are read directly, in file order
+        known = []
+        for code_point in remaining:
+            offset = self._glyph_offset(code_point)
+            if offset is not None:
+                known.append((offset, code_point))
+        known.sort()
+        reader = self._reader
+        values = self._values
+        loaded = 0
+        for offset, code_point in known:
+            if chunk_size and loaded >= chunk_size:
+                yield
+                loaded = 0
+            reader.seek(offset)
+            self._read_glyph(code_point, metrics_only)
+            remaining.remove(code_point)
+            loaded += 1
+        if self._scan_complete:
+            self._add_missing(remaining)
+        if not remaining or self._scan_complete:
+            return
 
-        self.file.seek(0)
+        # Resume scanning where the last scan stopped
+        lines = 0
+        record_start = self._scan_offset
+        reader.seek(self._scan_offset)
         while True:
-            line = self.file.readline()
-            if not line:
+            if chunk_size:
+                lines += 1
+                if lines >= _LINES_PER_STEP or loaded >= chunk_size:
+                    # Other loads may move the reader while this one is suspended
+                    position = reader.tell()
+                    yield
+                    reader.seek(position)
+                    lines = 0
+                    loaded = 0
+            if not reader.readline():
                 break
-            if line.startswith(b"CHARS "):
-                metadata = False
-            elif line.startswith(b"SIZE"):
-                _, self.point_size, self.x_resolution, self.y_resolution = line.split()
-            elif line.startswith(b"COMMENT"):
-                pass
-            elif line.startswith(b"STARTCHAR"):
-                character = True
-            elif line.startswith(b"ENDCHAR"):
-                character = False
-                if desired_character:
-                    bounds = current_info["bounds"]
-                    shift = current_info["shift"]
-                    gc.collect()
-                    self._glyphs[code_point] = Glyph(
-                        current_info["bitmap"],
-                        0,
-                        bounds[0],
-                        bounds[1],
-                        bounds[2],
-                        bounds[3],
-                        shift[0],
-                        shift[1],
-                    )
+            token = reader.token()
+            if token == _OTHER:
+                continue
+            if token == _STARTCHAR:
+                record_start = reader.line_offset()
+            elif token == _ENCODING:
+                _parse_ints(reader.block, reader.start + 8, reader.end, values)
+                code_point = values[0]
+                if code_point < 0:
+                    continue
+                self._index_glyph(code_point, record_start)
+                if code_point in remaining:
+                    self._read_glyph(code_point, metrics_only)
+                    self._scan_offset = max(self._scan_offset, reader.tell())
                     remaining.remove(code_point)
+                    loaded += 1
                     if not remaining:
                         return
-                desired_character = False
-            elif line.startswith(b"BBX"):
-                if desired_character:
-                    _, x, y, x_offset, y_offset = line.split()
-                    x = int(x)
-                    y = int(y)
-                    x_offset = int(x_offset)
-                    y_offset = int(y_offset)
-                    current_info["bounds"] = (x, y, x_offset, y_offset)
-                    current_info["bitmap"] = self.bitmap_class(x, y, 2)
-            elif line.startswith(b"BITMAP"):
-                if desired_character:
-                    rounded_x = x // 8
-                    if x % 8 > 0:
-                        rounded_x += 1
-                    bytes_per_row = rounded_x
-                    if bytes_per_row % 4 > 0:
-                        bytes_per_row += 4 - bytes_per_row % 4
-                    current_y = 0
-            elif line.startswith(b"ENCODING"):
-                _, code_point = line.split()
-                code_point = int(code_point)
-                if code_point in remaining:
-                    desired_character = True
-                    current_info = {"bitmap": None, "bounds": None, "shift": None}
-            elif line.startswith(b"DWIDTH"):
-                if desired_character:
-                    _, shift_x, shift_y = line.split()
-                    shift_x = int(shift_x)
-                    shift_y = int(shift_y)
-                    current_info["shift"] = (shift_x, shift_y)
-            elif line.startswith(b"SWIDTH"):
-                pass
-            elif character:
-                if desired_character:
-                    bits = int(line.strip(), 16)
-                    width = current_info["bounds"][0]
-                    start = current_y * width
+            elif token == _ENDCHAR:
+                self._scan_offset = max(self._scan_offset, reader.tell())
+            elif token == _SIZE:
+                _parse_ints(reader.block, reader.start + 4, reader.end, values)
+                self.point_size, self.x_resolution, self.y_resolution = values[:3]
+        self._scan_complete = True
+        self._add_missing(remaining)
+
+    def _add_missing(self, code_points: Iterable[int]) -> None:
+        for code_point in code_points:
+            # Skips the placeholder that _read_coverage scans for
+            if code_point >= 0:
+                self._missing.add(code_point)
+
+    def _read_coverage(self) -> CodePointRanges:
+        # Finish indexing the file. No record matches the negative code point.
+        for _ in self._load_steps((-1,), 0, True):
+            pass
+        if self._index_map is not None:
+            return CodePointRanges.from_code_points(self._index_map)
+        ranges = CodePointRanges()
+        for code_point in self._index_code_points:
+            ranges.add_range(code_point, code_point + 1)
+        return ranges
+
+    def _glyph_offset(self, code_point: int) -> Optional[int]:
+        """The file offset of the glyph's STARTCHAR line, if a scan has passed it"""
+        if self._index_map is not None:
+            return self._index_map.get(code_point)
+        code_points = self._index_code_points
+        lo = 0
+        hi = len(code_points)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if code_points[mid] < code_point:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(code_points) and code_points[lo] == code_point:
+            return self._index_offsets[lo]
+        return None
+
+    def _index_glyph(self, code_point: int, offset: int) -> None:
+        offsets = self._index_offsets
+        if offsets and offset <= offsets[-1]:
+            return
+        code_points = self._index_code_points
+        if self._index_map is not None:
+            self._index_map[code_point] = offset
+        elif code_points and code_point < code_points[-1]:
+            # Glyphs aren't in code point order so binary search won't work
+            self._index_map = dict(zip(code_points, offsets))
+            self._index_map[code_point] = offset
+        code_points.append(code_point)
+        offsets.append(offset)
+
+    def _read_glyph(self, code_point: int, metrics_only: bool) -> None:
+        """Parses a glyph record from the current position through ENDCHAR"""
+        reader = self._reader
+        values = self._values
+        width = height = x_offset = y_offset = 0
+        shift_x = shift_y = 0
+        bitmap = None
+        while reader.readline():
+            token = reader.token()
+            if token == _BBX:
+                _parse_ints(reader.block, reader.start + 3, reader.end, values)
+                width, height, x_offset, y_offset = values
+                if not metrics_only:
+                    bitmap = self._new_bitmap(width, height, 2)
+            elif token == _DWIDTH:
+                _parse_ints(reader.block, reader.start + 6, reader.end, values)
+                shift_x = values[0]
+                shift_y = values[1]
+            elif token == _BITMAP:
+                if metrics_only:
+                    continue
+                start = 0
+                while reader.readline() and reader.token() != _ENDCHAR:
+                    block = reader.block
                     x = 0
-                    for i in range(rounded_x):
-                        val = (bits >> ((rounded_x - i - 1) * 8)) & 0xFF
-                        for j in range(7, -1, -1):
+                    for i in range(reader.start, reader.end):
+                        nibble = _HEX_DIGITS[block[i]]
+                        for bit in (8, 4, 2, 1):
                             if x >= width:
                                 break
-                            bit = 0
-                            if val & (1 << j) != 0:
-                                bit = 1
-                            current_info["bitmap"][start + x] = bit
+                            if nibble & bit:
+                                bitmap[start + x] = 1
                             x += 1
-                    current_y += 1
-            elif metadata:
-                pass
+                    start += width
+                break
+            elif token == _ENDCHAR:
+                break
+
+        if metrics_only:
+            self._metrics.set(code_point, width, height, x_offset, y_offset, shift_x, shift_y)
+        else:
+            gc.collect()
+            self._glyphs[code_point] = Glyph(
+                bitmap, 0, width, height, x_offset, y_offset, shift_x, shift_y
+            )
+            self._metrics.pop(code_point, None)
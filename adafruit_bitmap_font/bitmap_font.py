@@ -23,6 +23,7 @@ Implementation Notes
 """
 
 try:
+    from io import FileIO
     from typing import Optional, Union
 
     from displayio import Bitmap
@@ -41,30 +42,57 @@ LVGL_HEADER_SIZE = b"\x30\x00\x00\x00"
 
 
 def load_font(
-    filename: str, bitmap: Optional[Bitmap] = None
+    filename: Union[str, bytes, bytearray, memoryview, FileIO], bitmap: Optional[Bitmap] = None
 ) -> Union[bdf.BDF, lvfontbin.LVGLFont, pcf.PCF, ttf.TTF]:
-    """Loads a font file. Returns None if unsupported."""
+    """Loads a font file. Returns None if unsupported.
+
+    :param filename: The name of the font file, the contents of a font file as ``bytes``,
+        ``bytearray`` or ``memoryview``, or a seekable file-like object opened in binary
+        mode. Fonts given as contents or file objects are recognized by their contents only.
+        Files are read through a `adafruit_bitmap_font.streams.BlockReader`.
+    """
     if not bitmap:
         import displayio
 
         bitmap = displayio.Bitmap
-    font_file = open(filename, "rb")
+    if isinstance(filename, str):
+        font_file = open(filename, "rb")
+    else:
+        if isinstance(filename, (bytes, bytearray, memoryview)):
+            from .streams import BufferFile
+
+            font_file = BufferFile(filename)
+        else:
+            font_file = filename
+            font_file.seek(0)
+        filename = ""
+    if getattr(font_file, "native", True):
+        from .streams import BlockReader
+
+        font_file = BlockReader(font_file)
     first_four = font_file.read(4)
-    if filename.endswith("bdf") and first_four == b"STAR":
+    if first_four[:2] == b"\x1f\x8b":
+        from .blockgzip import BlockGzipFile
+
+        font_file = BlockGzipFile(font_file)
+        if filename.endswith(".gz"):
+            filename = filename[:-3]
+        first_four = font_file.read(4)
+    if (not filename or filename.endswith("bdf")) and first_four == b"STAR":
         from . import bdf
 
         return bdf.BDF(font_file, bitmap)
-    if filename.endswith("pcf") and first_four == b"\x01fcp":
+    if (not filename or filename.endswith("pcf")) and first_four == b"\x01fcp":
         from . import pcf
 
         return pcf.PCF(font_file, bitmap)
-    if filename.endswith("ttf") and first_four == b"\x00\x01\x00\x00":
+    if (not filename or filename.endswith("ttf")) and first_four == b"\x00\x01\x00\x00":
         from . import ttf
 
         return ttf.TTF(font_file, bitmap)
 
     if (
-        filename.endswith("bin") or filename.endswith("lvfontbin")
+        not filename or filename.endswith("bin") or filename.endswith("lvfontbin")
     ) and first_four == LVGL_HEADER_SIZE:
         from . import lvfontbin
 
@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.blockgzip`
+====================================================
+
+Reads gzip compressed fonts without decompressing the whole file into memory.
+
+Fonts compressed in blocks, with every block a separate gzip member, can be read at any
+offset by only inflating the block that holds it. The file is still a normal gzip file
+that ``gunzip`` can decompress. Compress a font on a host computer with:
+
+.. code-block:: shell
+
+    python -m adafruit_bitmap_font.blockgzip fonts/font.pcf
+
+Plain ``.gz`` files also load but are decompressed as one stream, which has to restart
+from the beginning of the file whenever a loader seeks backwards.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from io import FileIO
+    from typing import List, Optional, Tuple
+except ImportError:
+    pass
+
+import struct
+import zlib
+from array import array
+
+from .glyph_cache import _bisect_right
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_FEXTRA = 4
+# Uncompressed bytes produced per step when decompressing a plain gzip stream
+_STREAM_CHUNK_SIZE = 1024
+
+
+class BlockGzipFile:
+    """A read only, seekable file over the decompressed contents of a gzip file.
+
+    Files written by `compress` hold each block as a gzip member with a ``BC`` extra field
+    giving its size, the same layout as BGZF. Their members are indexed when the file is
+    opened, keeping two integers per block, and one decompressed block at a time is kept
+    in memory.
+
+    :param file: The gzip file, opened in binary mode
+    """
+
+    # Not a native stream, so bitmaptools can't read from it directly
+    native = False
+
+    def __init__(self, file: FileIO) -> None:
+        self.file = file
+        self._position = 0
+        # Compressed offset and decompressed start of every block
+        self._offsets = array("I")
+        self._starts = array("I")
+        self._size = 0
+        # The decompressed block and its start
+        self._block = b""
+        self._block_start = 0
+        # Plain gzip streams are decompressed sequentially instead
+        self._stream = None
+        if not self._index_blocks():
+            self._restart_stream()
+
+    def _read_member_header(self, offset: int) -> Optional[Tuple[int, int]]:
+        """Returns the size of the block member at ``offset`` and the offset of its deflate
+        data, or None if it is not a block member. Returns (0, 0) at the end of the file."""
+        file = self.file
+        file.seek(offset)
+        header = file.read(12)
+        if not header:
+            return 0, 0
+        if len(header) < 12 or header[:2] != _GZIP_MAGIC:
+            raise ValueError("Not a gzip file")
+        if header[3] != _FEXTRA:
+            return None
+        (extra_size,) = struct.unpack("<H", header[10:12])
+        extra = file.read(extra_size)
+        i = 0
+        while i + 4 <= len(extra):
+            (field_size,) = struct.unpack("<H", extra[i + 2 : i + 4])
+            if extra[i : i + 2] == b"BC" and field_size == 2:
+                (member_size,) = struct.unpack("<H", extra[i + 4 : i + 6])
+                return member_size + 1, offset + 12 + extra_size
+            i += 4 + field_size
+        return None
+
+    def _index_blocks(self) -> bool:
+        """Indexes the members of a block compressed file. Returns False for other files."""
+        offset = 0
+        while True:
+            member = self._read_member_header(offset)
+            if member is None:
+                return False
+            member_size = member[0]
+            if not member_size:
+                return bool(self._offsets)
+            self.file.seek(offset + member_size - 4)
+            (block_size,) = struct.unpack("<I", self.file.read(4))
+            if block_size:
+                self._offsets.append(offset)
+                self._starts.append(self._size)
+                self._size += block_size
+            offset += member_size
+
+    def _load_block(self, index: int) -> None:
+        offset = self._offsets[index]
+        member_size, data_offset = self._read_member_header(offset)
+        self.file.seek(data_offset)
+        # The CRC and size follow the deflate data
+        data = self.file.read(offset + member_size - 8 - data_offset)
+        self._block = zlib.decompress(data, -15)
+        self._block_start = self._starts[index]
+
+    def _restart_stream(self) -> None:
+        if hasattr(zlib, "decompressobj"):
+            self.file.seek(0)
+            self._stream = zlib.decompressobj(31)
+        else:
+            import deflate
+
+            # DeflateIO needs a native stream, such as the file under a BlockReader
+            file = getattr(self.file, "raw", self.file)
+            file.seek(0)
+            self._stream = deflate.DeflateIO(file, deflate.GZIP)
+        self._block = b""
+        self._block_start = 0
+
+    def _next_stream_chunk(self) -> bytes:
+        stream = self._stream
+        if not hasattr(stream, "decompress"):
+            return stream.read(_STREAM_CHUNK_SIZE)
+        # Input past the end of a member is left in unused_data, and in unconsumed_tail too
+        data = b"" if stream.eof else stream.decompress(stream.unconsumed_tail, _STREAM_CHUNK_SIZE)
+        while not data:
+            if stream.eof:
+                # Concatenated gzip members decompress to one file
+                compressed = stream.unused_data or self.file.read(_STREAM_CHUNK_SIZE)
+                if not compressed:
+                    break
+                stream = self._stream = zlib.decompressobj(31)
+            else:
+                compressed = self.file.read(_STREAM_CHUNK_SIZE)
+                if not compressed:
+                    break
+            data = stream.decompress(compressed, _STREAM_CHUNK_SIZE)
+        return data
+
+    def _fill(self) -> bool:
+        """Makes the current block hold the position. Returns False at the end of file."""
+        position = self._position
+        if self._block_start <= position < self._block_start + len(self._block):
+            return True
+        if self._stream is None:
+            if position >= self._size:
+                return False
+            self._load_block(_bisect_right(self._starts, position) - 1)
+            return True
+        if position < self._block_start:
+            self._restart_stream()
+        while position >= self._block_start + len(self._block):
+            self._block_start += len(self._block)
+            self._block = self._next_stream_chunk()
+            if not self._block:
+                return False
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to ``size`` bytes, or to the end of the file when ``size`` is negative"""
+        chunks = []
+        while size != 0 and self._fill():
+            start = self._position - self._block_start
+            end = len(self._block) if size < 0 else min(start + size, len(self._block))
+            chunks.append(self._block[start:end])
+            self._position += end - start
+            if size > 0:
+                size -= end - start
+        return b"".join(chunks)
+
+    def readinto(self, buffer: bytearray) -> int:
+        """Reads into ``buffer`` and returns the number of bytes read"""
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Moves to ``offset`` relative to the start, current position or end of the file"""
+        if whence == 1:
+            offset += self._position
+        elif whence == 2:
+            if self._stream is not None:
+                while self._fill():
+                    self._position = self._block_start + len(self._block)
+                self._size = self._position
+            offset += self._size
+        self._position = max(offset, 0)
+        return self._position
+
+    def tell(self) -> int:
+        """The current position in the decompressed file"""
+        return self._position
+
+    def close(self) -> None:
+        """Closes the compressed file"""
+        self.file.close()
+
+
+def compress(source: FileIO, dest: FileIO, block_size: int = 4096) -> int:
+    """Compresses ``source`` into ``dest`` as independently decompressible gzip members of
+    ``block_size`` bytes each. Both files must be opened in binary mode. Returns the
+    compressed size. Requires CPython."""
+    if not 0 < block_size <= 0xFF00:
+        raise ValueError("block_size must be between 1 and 65280")
+    written = 0
+    while True:
+        block = source.read(block_size)
+        if not block:
+            break
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+        data = compressor.compress(block) + compressor.flush()
+        member_size = 18 + len(data) + 8
+        if member_size > 0x10000:
+            raise ValueError("Block does not compress, use a smaller block_size")
+        member = (
+            _GZIP_MAGIC
+            + bytes((8, _FEXTRA, 0, 0, 0, 0, 0, 255))
+            + struct.pack("<HBBHH", 6, ord("B"), ord("C"), 2, member_size - 1)
+            + data
+            + struct.pack("<II", zlib.crc32(block), len(block))
+        )
+        dest.write(member)
+        written += len(member)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point, see the module documentation"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compresses fonts into seekable gzip files.")
+    parser.add_argument("fonts", nargs="+", help="fonts to compress, written to <font>.gz")
+    parser.add_argument("--block-size", type=int, default=4096, help="uncompressed block size")
+    args = parser.parse_args(argv)
+
+    for font in args.fonts:
+        with open(font, "rb") as source, open(font + ".gz", "wb") as dest:
+            size = compress(source, dest, args.block_size)
+        print(f"Wrote {size} bytes to {font}.gz")
+
+
+if __name__ == "__main__":
+    main()
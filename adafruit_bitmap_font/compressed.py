@@ -0,0 +1,318 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.compressed`
+====================================================
+
+Keeps glyph bitmaps run-length encoded in memory so that more glyphs fit in the cache.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+    from displayio import Bitmap
+except ImportError:
+    pass
+
+from fontio import Glyph
+
+from .glyph_cache import BitmapPool, CodePointRanges, GlyphCache, _to_code_points
+
+try:
+    from bitmaptools import fill_region as _fill_region
+except ImportError:
+    _fill_region = None
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+
+class RLEBitmap:
+    """A read only bitmap stored as runs of set pixels.
+
+    Each row is a run count followed by one ``skip, length`` pair per run, where ``skip``
+    is the number of background pixels before the run. Runs of bitmaps with more than one
+    non-zero value also store the value. Blank space costs next to nothing, which suits
+    large icon glyphs.
+
+    Pixels can be read like a displayio.Bitmap, decoding one row at a time, and
+    `adafruit_bitmap_font.render.render_text` draws the runs straight into its target.
+
+    :param source: The bitmap to encode
+    """
+
+    def __init__(self, source: Bitmap) -> None:
+        self.width = width = source.width
+        self.height = source.height
+        rows = []
+        multi_value = False
+        for y in range(self.height):
+            row = []
+            x = 0
+            while x < width:
+                value = source[x, y]
+                if not value:
+                    x += 1
+                    continue
+                start = x
+                while x < width and source[x, y] == value:
+                    x += 1
+                row.append((start, x, value))
+                multi_value = multi_value or value > 1
+            rows.append(row)
+        self._stride = 3 if multi_value else 2
+
+        data = bytearray()
+        for row in rows:
+            self._encode_row(data, row)
+        self.data = data
+        # The last decoded row, for reading pixels
+        self._row_y = None
+        self._row_offset = 0
+        self._pixels = bytearray(width)
+
+    def _encode_row(self, data: bytearray, row: Sequence[Tuple[int, int, int]]) -> None:
+        count_index = len(data)
+        data.append(0)
+        count = 0
+        end = 0
+        for start, stop, value in row:
+            skip = start - end
+            # Skips and lengths over 255 become several runs
+            while skip > 255:
+                self._append_run(data, 255, 0, value)
+                skip -= 255
+                count += 1
+            length = stop - start
+            while length > 255:
+                self._append_run(data, skip, 255, value)
+                skip = 0
+                length -= 255
+                count += 1
+            self._append_run(data, skip, length, value)
+            count += 1
+            end = stop
+        if count > 255:
+            raise ValueError("Bitmap too wide to encode")
+        data[count_index] = count
+
+    def _append_run(self, data: bytearray, skip: int, length: int, value: int) -> None:
+        data.append(skip)
+        data.append(length)
+        if self._stride == 3:
+            data.append(value)
+
+    def _row_start(self, y: int) -> int:
+        """The offset of row ``y`` in ``data``, found from the nearest decoded row"""
+        if self._row_y is not None and self._row_y <= y:
+            row = self._row_y
+            offset = self._row_offset
+        else:
+            row = 0
+            offset = 0
+        data = self.data
+        stride = self._stride
+        while row < y:
+            offset += 1 + data[offset] * stride
+            row += 1
+        return offset
+
+    def _decode_row(self, y: int) -> None:
+        offset = self._row_start(y)
+        self._row_y = y
+        self._row_offset = offset
+        pixels = self._pixels
+        for x in range(self.width):
+            pixels[x] = 0
+        data = self.data
+        stride = self._stride
+        x = 0
+        for run in range(data[offset]):
+            run_offset = offset + 1 + run * stride
+            x += data[run_offset]
+            length = data[run_offset + 1]
+            value = data[run_offset + 2] if stride == 3 else 1
+            for _ in range(length):
+                pixels[x] = value
+                x += 1
+
+    def __getitem__(self, index: Union[Tuple[int, int], int]) -> int:
+        if isinstance(index, tuple):
+            x, y = index
+        else:
+            y, x = divmod(index, self.width)
+        if y != self._row_y:
+            self._decode_row(y)
+        return self._pixels[x]
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def blit(  # noqa: PLR0913, PLR0917
+        self,
+        target: Bitmap,
+        x: int,
+        y: int,
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int,
+        palette_map: Optional[Sequence[int]],
+        skip_index: Optional[int],
+    ) -> None:
+        """Draws the ``(x1, y1, x2, y2)`` area into ``target`` with its top left corner at
+        ``(x, y)``. Takes the same arguments as ``render_text`` for mapping pixel values.
+        Runs are filled with ``bitmaptools.fill_region`` when it is available."""
+        data = self.data
+        stride = self._stride
+        offset = self._row_start(y1)
+        background = None
+        if skip_index != 0:
+            background = palette_map[0] if palette_map is not None else 0
+        x -= x1
+        for source_y in range(y1, y2):
+            target_y = y + source_y - y1
+            end = 0
+            count = data[offset]
+            offset += 1
+            for _ in range(count):
+                start = end + data[offset]
+                if background is not None and max(end, x1) < min(start, x2):
+                    _fill(target, x + max(end, x1), target_y, x + min(start, x2), background)
+                end = start + data[offset + 1]
+                value = data[offset + 2] if stride == 3 else 1
+                offset += stride
+                if value == skip_index:
+                    continue
+                start = max(start, x1)
+                stop = min(end, x2)
+                if start < stop:
+                    if palette_map is not None:
+                        value = palette_map[value]
+                    _fill(target, x + start, target_y, x + stop, value)
+            if background is not None and max(end, x1) < x2:
+                _fill(target, x + max(end, x1), target_y, x + x2, background)
+
+
+def _fill(target: Bitmap, x1: int, y: int, x2: int, value: int) -> None:
+    if _fill_region:
+        _fill_region(target, x1, y, x2, y + 1, value)
+        return
+    for x in range(x1, x2):
+        target[x, y] = value
+
+
+def compress_glyph(glyph: Glyph) -> Glyph:
+    """Returns a copy of ``glyph`` whose bitmap is an `RLEBitmap`"""
+    return Glyph(
+        RLEBitmap(glyph.bitmap),
+        glyph.tile_index,
+        glyph.width,
+        glyph.height,
+        glyph.dx,
+        glyph.dy,
+        glyph.shift_x,
+        glyph.shift_y,
+    )
+
+
+class CompressedFont(GlyphCache):
+    """A `GlyphCache` that keeps the glyphs of ``font`` as `RLEBitmap` glyphs.
+
+    Glyphs are decoded by ``font`` and compressed as they are loaded, and the uncompressed
+    copies are dropped from ``font``. Use it with
+    `adafruit_bitmap_font.render.render_text` or `adafruit_bitmap_font.render_cache`; code
+    that passes glyph bitmaps to ``bitmaptools`` needs real displayio.Bitmap glyphs.
+
+    :param font: The font to load glyphs from
+    """
+
+    def __init__(self, font: GlyphCache) -> None:
+        super().__init__()
+        self.font = font
+        self.fixed_advance = getattr(font, "fixed_advance", None)
+
+    @property
+    def ascent(self) -> int:
+        """The number of pixels above the baseline of a typical ascender"""
+        return self.font.ascent
+
+    @property
+    def descent(self) -> int:
+        """The number of pixels below the baseline of a typical descender"""
+        return self.font.descent
+
+    def get_bounding_box(self) -> Tuple[int, int, int, int]:
+        """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
+        return self.font.get_bounding_box()
+
+    @property
+    def bitmap_pool(self) -> Optional[BitmapPool]:
+        """The `BitmapPool` of ``font``, which decodes the glyphs before they are
+        compressed"""
+        return self.font.bitmap_pool
+
+    @bitmap_pool.setter
+    def bitmap_pool(self, pool: Optional[BitmapPool]) -> None:
+        self.font.bitmap_pool = pool
+
+    def reserve_bitmaps(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        self.font.reserve_bitmaps(code_points)
+
+    def _recycle(self, code_point: int, glyph: Glyph) -> None:
+        # Compressed bitmaps don't belong in the pool
+        pass
+
+    def _discard(self, code_points: List[int]) -> None:
+        self.font._discard(code_points)
+        super()._discard(code_points)
+
+    def _bits_per_value(self, code_point: int) -> int:
+        return self.font._bits_per_value(code_point)
+
+    def _read_coverage(self) -> CodePointRanges:
+        return self.font.coverage()
+
+    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        code_points = _to_code_points(code_points)
+
+        # A repeated code point would find its glyph already taken from font
+        code_points = [cp for cp in dict.fromkeys(code_points) if self._glyphs.get(cp) is None]
+        if not code_points:
+            return
+        font = self.font
+        font.load_glyphs(code_points)
+        for code_point in code_points:
+            glyph = font._glyphs.pop(code_point, None)
+            self._glyphs[code_point] = compress_glyph(glyph) if glyph else None
+            # The uncompressed bitmap can be reused for the next glyph of its size
+            if glyph:
+                font._recycle(code_point, glyph)
+            self._metrics.pop(code_point, None)
+
+    def load_metrics(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        code_points = _to_code_points(code_points)
+
+        code_points = [
+            cp for cp in code_points if cp not in self._glyphs and cp not in self._metrics
+        ]
+        self.font.load_metrics(code_points)
+        for code_point in code_points:
+            glyph = self.font._metrics.get(code_point)
+            if glyph is not None:
+                self._metrics[code_point] = glyph
@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.convert`
+====================================================
+
+Converts whole fonts to PCF or BDF on a host computer, decoding the glyphs of each font in
+parallel across a ``multiprocessing`` pool:
+
+.. code-block:: shell
+
+    python -m adafruit_bitmap_font.convert --output-dir bundle --format pcf fonts/*.bdf
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* CPython on the host, this module is not supported on CircuitPython
+
+"""
+
+try:
+    from typing import Dict, Iterable, List, Optional, Tuple
+except ImportError:
+    pass
+
+from fontio import Glyph
+
+from . import bitmap_font, subset
+from .glyph_cache import GlyphCache
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+# Fonts opened by this worker process, by filename
+_worker_fonts = {}
+
+
+class _PixelBitmap:
+    """Byte per pixel bitmap that can be created without displayio in worker processes"""
+
+    def __init__(self, width: int, height: int, value_count: int) -> None:
+        self.width = width
+        self.height = height
+        self.values = bytearray(width * height)
+
+    def __setitem__(self, index, value: int) -> None:
+        if isinstance(index, tuple):
+            index = index[0] + index[1] * self.width
+        self.values[index] = value
+
+    def __getitem__(self, index) -> int:
+        if isinstance(index, tuple):
+            index = index[0] + index[1] * self.width
+        return self.values[index]
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+
+class _DecodedFont(GlyphCache):
+    """Glyphs decoded by the workers, merged back into one font for the writers"""
+
+    def __init__(self, info: Tuple) -> None:
+        super().__init__()
+        self.ascent, self.descent, self._bounding_box = info
+
+    def get_bounding_box(self) -> Tuple[int, int, int, int]:
+        """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
+        return self._bounding_box
+
+    def get_glyph(self, code_point: int) -> Glyph:
+        return self._glyphs.get(code_point)
+
+
+def _open(filename: str) -> GlyphCache:
+    font = _worker_fonts.get(filename)
+    if font is None:
+        font = _worker_fonts[filename] = bitmap_font.load_font(filename, _PixelBitmap)
+    return font
+
+
+def _font_info(filename: str) -> Tuple:
+    font = _open(filename)
+    return font.ascent, font.descent, font.get_bounding_box()
+
+
+def _list_code_points(filename: str) -> List[int]:
+    return list(_open(filename).coverage())
+
+
+def _decode_shard(task: Tuple[int, str, List[int]]) -> Tuple[int, List[Tuple]]:
+    """Decodes ``code_points`` of ``filename`` into picklable tuples"""
+    job, filename, code_points = task
+    font = _open(filename)
+    font.load_glyphs(code_points)
+    decoded = []
+    for code_point in code_points:
+        glyph = font._glyphs.pop(code_point, None)
+        if glyph:
+            decoded.append(
+                (
+                    code_point,
+                    bytes(glyph.bitmap.values),
+                    glyph.width,
+                    glyph.height,
+                    glyph.dx,
+                    glyph.dy,
+                    glyph.shift_x,
+                    glyph.shift_y,
+                )
+            )
+    return job, decoded
+
+
+def convert_fonts(
+    jobs: Iterable[Tuple[str, str]],
+    code_points: Optional[Iterable[int]] = None,
+    processes: Optional[int] = None,
+    chunk_size: int = 256,
+) -> Dict[str, int]:
+    """Converts each ``(source, output)`` pair of filenames. The output format is PCF
+    unless ``output`` ends with ``.bdf``. PCF can only hold code points up to 0xFFFF so
+    any above that are left out of PCF outputs.
+
+    The code points of every font are split into shards of ``chunk_size`` that are decoded
+    by a pool of ``processes`` worker processes, one CPU each by default. The decoded
+    glyphs are then merged and written by the main process.
+
+    :param code_points: The code points to convert. Defaults to every code point in each
+        font.
+    :return: The number of glyphs written to each output
+    """
+    from multiprocessing import Pool
+
+    jobs = list(jobs)
+    if code_points is not None:
+        code_points = sorted(set(code_points))
+    with Pool(processes) as pool:
+        sources = [source for source, _ in jobs]
+        infos = pool.map(_font_info, sources)
+        if code_points is None:
+            font_code_points = pool.map(_list_code_points, sources)
+        else:
+            font_code_points = [code_points] * len(jobs)
+
+        tasks = []
+        for job, (source, output) in enumerate(jobs):
+            points = font_code_points[job]
+            if not output.endswith(".bdf"):
+                points = [c for c in points if c <= 0xFFFF]
+            for i in range(0, len(points), chunk_size):
+                tasks.append((job, source, points[i : i + chunk_size]))
+
+        fonts = [_DecodedFont(info) for info in infos]
+        for job, decoded in pool.imap_unordered(_decode_shard, tasks):
+            glyphs = fonts[job]._glyphs
+            for code_point, pixels, *metrics in decoded:
+                glyphs[code_point] = Glyph(pixels, 0, *metrics)
+
+    written = {}
+    for (_, output), font in zip(jobs, fonts):
+        with open(output, "wb") as file:
+            if output.endswith(".bdf"):
+                written[output] = subset.write_bdf(font, font._glyphs, file)
+            else:
+                written[output] = subset.write_pcf(font, font._glyphs, file)
+    return written
+
+
+def convert(
+    source: str,
+    output: str,
+    code_points: Optional[Iterable[int]] = None,
+    processes: Optional[int] = None,
+) -> int:
+    """Converts one font with `convert_fonts` and returns the number of glyphs written"""
+    return convert_fonts([(source, output)], code_points, processes)[output]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point, see the module documentation"""
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Converts fonts to PCF or BDF in parallel.")
+    parser.add_argument("fonts", nargs="+", help="fonts to convert")
+    parser.add_argument("--output-dir", default=".", help="directory to write to")
+    parser.add_argument("--format", choices=("pcf", "bdf"), default="pcf")
+    parser.add_argument("--processes", type=int, default=None, help="defaults to one per CPU")
+    args = parser.parse_args(argv)
+
+    jobs = []
+    for source in args.fonts:
+        name = os.path.splitext(os.path.basename(source))[0] + "." + args.format
+        jobs.append((source, os.path.join(args.output_dir, name)))
+    for output, count in convert_fonts(jobs, processes=args.processes).items():
+        print(f"Wrote {count} glyphs to {output}")
+
+
+if __name__ == "__main__":
+    main()
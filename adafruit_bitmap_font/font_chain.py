@@ -0,0 +1,239 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.font_chain`
+====================================================
+
+Combines several fonts into one, for example a Latin font with fallbacks for icons and CJK.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterable, List, Optional, Sequence, Tuple, Union
+except ImportError:
+    pass
+
+from fontio import Glyph
+
+from .glyph_cache import _ABSENT, BitmapPool, CodePointRanges, GlyphCache, _to_code_points
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+# Route of code points that none of the fonts have
+_MISSING = -1
+
+
+class FontChain(GlyphCache):
+    """A `GlyphCache` that takes each glyph from the first font in ``fonts`` that has it.
+
+    The font that has a code point is worked out once from the `GlyphCache.coverage` of
+    each font and remembered so later lookups go straight to it. Loads are batched so that
+    each font is asked for all of its code points at once.
+
+    Glyphs keep their metrics relative to the shared baseline. ``baseline_offsets`` moves
+    the glyphs of each font up by that many pixels, for example to center icons on the
+    text. The ascent, descent and bounding box cover all of the fonts.
+
+    :param fonts: The fonts to search, in order
+    :param baseline_offsets: Pixels to raise the glyphs of each font by. Defaults to 0 for
+        every font.
+    """
+
+    def __init__(
+        self, fonts: Iterable[GlyphCache], baseline_offsets: Optional[Sequence[int]] = None
+    ) -> None:
+        super().__init__()
+        self.fonts = list(fonts)
+        if baseline_offsets is None:
+            baseline_offsets = [0] * len(self.fonts)
+        self._offsets = list(baseline_offsets)
+        if len(self._offsets) != len(self.fonts):
+            raise ValueError("baseline_offsets must have one entry per font")
+        # Code point to the index of the font that has it, or _MISSING
+        self._routes = {}
+
+        ascent = descent = 0
+        for font, offset in zip(self.fonts, self._offsets):
+            # LVGL fonts store the descent as a negative offset from the baseline
+            ascent = max(ascent, (font.ascent or 0) + offset)
+            descent = max(descent, abs(font.descent or 0) - offset)
+        self._ascent = ascent
+        self._descent = descent
+
+        advances = {getattr(font, "fixed_advance", None) for font in self.fonts}
+        if len(advances) == 1:
+            self.fixed_advance = advances.pop()
+
+    @property
+    def ascent(self) -> int:
+        """The number of pixels above the baseline of a typical ascender"""
+        return self._ascent
+
+    @property
+    def descent(self) -> int:
+        """The number of pixels below the baseline of a typical descender"""
+        return self._descent
+
+    def get_bounding_box(self) -> Tuple[int, int, int, int]:
+        """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
+        left = bottom = right = top = None
+        for font, offset in zip(self.fonts, self._offsets):
+            width, height, x_offset, y_offset = font.get_bounding_box()
+            y_offset += offset
+            if left is None:
+                left, bottom = x_offset, y_offset
+                right, top = x_offset + width, y_offset + height
+                continue
+            left = min(left, x_offset)
+            bottom = min(bottom, y_offset)
+            right = max(right, x_offset + width)
+            top = max(top, y_offset + height)
+        return right - left, top - bottom, left, bottom
+
+    def font_for(self, code_point: int) -> Optional[GlyphCache]:
+        """Returns the font that the glyph of ``code_point`` comes from, or None if no font
+        has it."""
+        self._route((code_point,))
+        index = self._routes[code_point]
+        return None if index == _MISSING else self.fonts[index]
+
+    def _read_coverage(self) -> CodePointRanges:
+        ranges = []
+        for font in self.fonts:
+            ranges.extend(font.coverage().ranges())
+        ranges.sort()
+        coverage = CodePointRanges()
+        for start, stop in ranges:
+            coverage.add_range(start, stop)
+        return coverage
+
+    @property
+    def bitmap_pool(self) -> Optional[BitmapPool]:
+        """The `BitmapPool` shared by the fonts. Setting it sets it on every font."""
+        return self.fonts[0].bitmap_pool if self.fonts else None
+
+    @bitmap_pool.setter
+    def bitmap_pool(self, pool: Optional[BitmapPool]) -> None:
+        for font in self.fonts:
+            font.bitmap_pool = pool
+
+    def reserve_bitmaps(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        for index, group in enumerate(self._group(code_points)):
+            if group:
+                self.fonts[index].reserve_bitmaps(group)
+
+    def _recycle(self, code_point: int, glyph: Glyph) -> None:
+        # evict passes the glyph on to the font it came from, which recycles the bitmap
+        pass
+
+    def _discard(self, code_points: List[int]) -> None:
+        for code_point in code_points:
+            index = self._routes.get(code_point, _MISSING)
+            if index != _MISSING:
+                self.fonts[index]._discard((code_point,))
+        super()._discard(code_points)
+
+    def _bits_per_value(self, code_point: int) -> int:
+        font = self.font_for(code_point)
+        return font._bits_per_value(code_point) if font else 1
+
+    def _route(self, code_points: Iterable[int]) -> None:
+        """Works out which font has each of the code points that are not routed yet"""
+        coverages = [font.coverage() for font in self.fonts]
+        for code_point in code_points:
+            if code_point in self._routes:
+                continue
+            self._routes[code_point] = _MISSING
+            for index, coverage in enumerate(coverages):
+                if code_point in coverage:
+                    self._routes[code_point] = index
+                    break
+
+    def _group(self, code_points: Union[int, str, Iterable[int]]) -> List[List[int]]:
+        """Routes the code points and splits them into one list per font. Code points that
+        no font has are stored as missing."""
+        code_points = _to_code_points(code_points)
+
+        self._route(code_points)
+        groups = [[] for _ in self.fonts]
+        for code_point in code_points:
+            index = self._routes[code_point]
+            if index == _MISSING:
+                self._glyphs[code_point] = None
+            else:
+                groups[index].append(code_point)
+        return groups
+
+    def _adjust(self, glyph: Glyph, index: int) -> Glyph:
+        offset = self._offsets[index]
+        if not offset or glyph is None:
+            return glyph
+        return Glyph(
+            glyph.bitmap,
+            glyph.tile_index,
+            glyph.width,
+            glyph.height,
+            glyph.dx,
+            glyph.dy + offset,
+            glyph.shift_x,
+            glyph.shift_y,
+        )
+
+    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        for index, group in enumerate(self._group(code_points)):
+            needed = [cp for cp in group if self._glyphs.get(cp) is None]
+            if not needed:
+                continue
+            font = self.fonts[index]
+            font.load_glyphs(needed)
+            for code_point in needed:
+                self._glyphs[code_point] = self._adjust(font._glyphs.get(code_point), index)
+                self._metrics.pop(code_point, None)
+
+    def load_metrics(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        for index, group in enumerate(self._group(code_points)):
+            needed = [
+                cp
+                for cp in dict.fromkeys(group)
+                if cp not in self._glyphs and cp not in self._metrics
+            ]
+            if not needed:
+                continue
+            font = self.fonts[index]
+            font.load_metrics(needed)
+            for code_point in needed:
+                glyph = font._glyphs.get(code_point)
+                if glyph is None:
+                    glyph = font._metrics.get(code_point)
+                self._metrics[code_point] = self._adjust(glyph, index)
+
+    def get_glyph(self, code_point: int) -> Glyph:
+        glyph = self._glyphs.get(code_point, _ABSENT)
+        if glyph is _ABSENT:
+            self.load_glyphs((code_point,))
+            glyph = self._glyphs.get(code_point)
+        return glyph
+
+    def evict(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        code_points = _to_code_points(code_points)
+
+        for code_point in code_points:
+            index = self._routes.get(code_point, _MISSING)
+            if index != _MISSING:
+                self.fonts[index].evict((code_point,))
+            super().evict((code_point,))
@@ -23,31 +23,724 @@ Implementation Notes
 """
 
 try:
-    from typing import Iterable, Union
+    from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
-    from fontio import Glyph
+    from displayio import Bitmap
 except ImportError:
     pass
 
 import gc
+from array import array
+
+from fontio import Glyph
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
 
+# Approximate bytes taken by a Glyph, its Bitmap object and its cache entry, on top of the
+# pixels of the bitmap
+_GLYPH_OVERHEAD = 96
+
+
+def _value_bits(value_count: int) -> int:
+    """The bits per pixel of a displayio.Bitmap of ``value_count`` values. displayio rounds
+    them up to a power of two."""
+    bits = 1
+    while 1 << bits < value_count:
+        bits *= 2
+    return bits
+
+
+def _bitmap_bytes(width: int, height: int, bits: int) -> int:
+    """The size of the pixels of a displayio.Bitmap, whose rows are padded to 32 bit words"""
+    return (width * bits + 31) // 32 * 4 * height
+
+
+def _to_code_points(code_points: Union[int, str, Iterable[int]]) -> List[int]:
+    """Turns the code points argument of the loading methods into a new list"""
+    if isinstance(code_points, int):
+        return [code_points]
+    if isinstance(code_points, str):
+        return [ord(c) for c in code_points]
+    return list(code_points)
+
+
+def _bisect_right(values, value: int) -> int:
+    lo = 0
+    hi = len(values)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if value < values[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+class CodePointRanges:
+    """Sorted, non-overlapping ranges of code points, such as those a font has glyphs for.
+    Checking a code point is a binary search over the ranges."""
+
+    def __init__(self) -> None:
+        self.starts = array("I")
+        # Exclusive ends of the ranges
+        self.stops = array("I")
+
+    @classmethod
+    def from_code_points(cls, code_points: Iterable[int]) -> "CodePointRanges":
+        """Builds the ranges of code points given in any order"""
+        ranges = cls()
+        for code_point in sorted(code_points):
+            ranges.add_range(code_point, code_point + 1)
+        return ranges
+
+    def add_range(self, start: int, stop: int) -> None:
+        """Adds ``range(start, stop)``. Ranges must be added in order of their start."""
+        if start >= stop:
+            return
+        stops = self.stops
+        if stops and start <= stops[-1]:
+            if start < self.starts[-1]:
+                raise ValueError("Ranges must be added in order")
+            stops[-1] = max(stops[-1], stop)
+            return
+        self.starts.append(start)
+        stops.append(stop)
+
+    def add(self, code_point: int) -> None:
+        """Adds one code point, in any order"""
+        starts = self.starts
+        stops = self.stops
+        index = _bisect_right(starts, code_point) - 1
+        if index >= 0 and code_point < stops[index]:
+            return
+        joins_previous = index >= 0 and stops[index] == code_point
+        joins_next = index + 1 < len(starts) and starts[index + 1] == code_point + 1
+        if joins_previous and joins_next:
+            stops[index] = stops[index + 1]
+            self.starts = starts[: index + 1] + starts[index + 2 :]
+            self.stops = stops[: index + 1] + stops[index + 2 :]
+        elif joins_previous:
+            stops[index] = code_point + 1
+        elif joins_next:
+            starts[index + 1] = code_point
+        else:
+            index += 1
+            self.starts = starts[:index] + array("I", (code_point,)) + starts[index:]
+            self.stops = stops[:index] + array("I", (code_point + 1,)) + stops[index:]
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        """The ``(start, stop)`` pairs of the ranges, with ``stop`` exclusive"""
+        return list(zip(self.starts, self.stops))
+
+    def __contains__(self, code_point: int) -> bool:
+        index = _bisect_right(self.starts, code_point) - 1
+        return index >= 0 and code_point < self.stops[index]
+
+    def __len__(self) -> int:
+        return sum(stop - start for start, stop in zip(self.starts, self.stops))
+
+    def __iter__(self) -> Iterator[int]:
+        for start, stop in zip(self.starts, self.stops):
+            yield from range(start, stop)
+
+
+# Pages of CodePointMap with more entries than this switch to one slot per code point
+_DENSE_PAGE = 192
+# Marks absent entries, since None is a value
+_ABSENT = object()
+
+
+class _SparsePage:
+    """The entries of one page as sorted low bytes of the code points and their values"""
+
+    def __init__(self) -> None:
+        self.lows = bytearray()
+        self.values = []
+
+    def find(self, low: int) -> int:
+        """Returns the index of ``low``, or -1 - the index to insert it at"""
+        index = _bisect_right(self.lows, low) - 1
+        if index >= 0 and self.lows[index] == low:
+            return index
+        return -2 - index
+
+
+class CodePointMap:
+    """A mapping of code points to values with less overhead per entry than a ``dict`` when
+    many code points of a Unicode block are stored, as when caching CJK glyphs. See
+    `GlyphCache.use_code_point_map`.
+
+    Code points are grouped into pages of 256 by their high bits. A page holds the sorted
+    low bytes of its code points and a list of their values, found with a binary search,
+    until it has more than 192 entries. It then becomes a list with one slot per code
+    point. It supports the parts of the ``dict`` interface that `GlyphCache` uses, and
+    iterates in code point order."""
+
+    def __init__(self) -> None:
+        self._pages = {}
+        self._length = 0
+
+    def _lookup(self, code_point: int):
+        page = self._pages.get(code_point >> 8)
+        if page is None:
+            return _ABSENT
+        if isinstance(page, list):
+            return page[code_point & 0xFF]
+        index = page.find(code_point & 0xFF)
+        return page.values[index] if index >= 0 else _ABSENT
+
+    def get(self, code_point: int, default=None):
+        """Returns the value of ``code_point``, or ``default`` if it is not stored"""
+        value = self._lookup(code_point)
+        return default if value is _ABSENT else value
+
+    def __getitem__(self, code_point: int):
+        value = self._lookup(code_point)
+        if value is _ABSENT:
+            raise KeyError(code_point)
+        return value
+
+    def __contains__(self, code_point: int) -> bool:
+        return self._lookup(code_point) is not _ABSENT
+
+    def __setitem__(self, code_point: int, value) -> None:
+        high = code_point >> 8
+        low = code_point & 0xFF
+        page = self._pages.get(high)
+        if page is None:
+            page = self._pages[high] = _SparsePage()
+        if isinstance(page, list):
+            if page[low] is _ABSENT:
+                self._length += 1
+            page[low] = value
+            return
+        index = page.find(low)
+        if index >= 0:
+            page.values[index] = value
+            return
+        index = -1 - index
+        page.lows = page.lows[:index] + bytes((low,)) + page.lows[index:]
+        page.values.insert(index, value)
+        self._length += 1
+        if len(page.values) > _DENSE_PAGE:
+            dense = [_ABSENT] * 256
+            for i, page_low in enumerate(page.lows):
+                dense[page_low] = page.values[i]
+            self._pages[high] = dense
+
+    def pop(self, code_point: int, default=_ABSENT):
+        """Removes ``code_point`` and returns its value, or ``default`` if it is not
+        stored"""
+        high = code_point >> 8
+        low = code_point & 0xFF
+        page = self._pages.get(high)
+        value = _ABSENT
+        if isinstance(page, list):
+            value = page[low]
+            page[low] = _ABSENT
+            if value is not _ABSENT and all(slot is _ABSENT for slot in page):
+                del self._pages[high]
+        elif page is not None:
+            index = page.find(low)
+            if index >= 0:
+                value = page.values.pop(index)
+                page.lows = page.lows[:index] + page.lows[index + 1 :]
+                if not page.values:
+                    del self._pages[high]
+        if value is _ABSENT:
+            if default is _ABSENT:
+                raise KeyError(code_point)
+            return default
+        self._length -= 1
+        return value
+
+    def setdefault(self, code_point: int, default=None):
+        """Returns the value of ``code_point``, storing ``default`` first if it is not
+        stored"""
+        value = self._lookup(code_point)
+        if value is _ABSENT:
+            self[code_point] = value = default
+        return value
+
+    def items(self) -> Iterator[Tuple[int, object]]:
+        """Yields the stored code points and their values in code point order"""
+        for high in sorted(self._pages):
+            page = self._pages[high]
+            base = high << 8
+            if isinstance(page, list):
+                for low, value in enumerate(page):
+                    if value is not _ABSENT:
+                        yield base + low, value
+            else:
+                for i, low in enumerate(page.lows):
+                    yield base + low, page.values[i]
+
+    def keys(self) -> Iterator[int]:
+        """Yields the stored code points in order"""
+        for code_point, _ in self.items():
+            yield code_point
+
+    def values(self) -> Iterator[object]:
+        """Yields the stored values in code point order"""
+        for _, value in self.items():
+            yield value
+
+    def __iter__(self) -> Iterator[int]:
+        return self.keys()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def clear(self) -> None:
+        """Removes every entry"""
+        self._pages = {}
+        self._length = 0
+
+
+class MetricsStore:
+    """The metrics of glyphs whose bitmaps are not loaded, keyed by code point.
+
+    Metrics are kept in columns of 16 bit integers, one slot per code point, instead of a
+    Glyph object per code point. Reading an entry creates a Glyph with a ``bitmap`` of
+    ``None``. Code points stored as ``None`` are remembered as having no glyph. It
+    supports the parts of the ``dict`` interface that `GlyphCache` uses."""
+
+    def __init__(self) -> None:
+        # Code point to slot, or -1 for code points without a glyph
+        self._slots = {}
+        # Slots released by pop, to be reused
+        self._free = []
+        self.width = array("h")
+        self.height = array("h")
+        self.dx = array("h")
+        self.dy = array("h")
+        self.shift_x = array("h")
+        self.shift_y = array("h")
+
+    def set(  # noqa: PLR0913, PLR0917
+        self,
+        code_point: int,
+        width: int,
+        height: int,
+        dx: int,
+        dy: int,
+        shift_x: int,
+        shift_y: int,
+    ) -> None:
+        """Stores the metrics of ``code_point`` without creating a Glyph"""
+        slot = self._slots.get(code_point, -1)
+        if slot < 0:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self.width)
+                for column in (self.width, self.height, self.dx, self.dy, self.shift_x):
+                    column.append(0)
+                self.shift_y.append(0)
+        self.width[slot] = width
+        self.height[slot] = height
+        self.dx[slot] = dx
+        self.dy[slot] = dy
+        self.shift_x[slot] = shift_x
+        self.shift_y[slot] = shift_y
+        # Only published once the columns are written
+        self._slots[code_point] = slot
+
+    def _glyph(self, slot: int) -> Optional[Glyph]:
+        if slot < 0:
+            return None
+        return Glyph(
+            None,
+            0,
+            self.width[slot],
+            self.height[slot],
+            self.dx[slot],
+            self.dy[slot],
+            self.shift_x[slot],
+            self.shift_y[slot],
+        )
+
+    def advance(self, code_point: int, default: Optional[int] = None) -> Optional[int]:
+        """Returns the ``shift_x`` of ``code_point`` without creating a Glyph. Returns None
+        for code points stored without a glyph and ``default`` if it is not stored."""
+        slot = self._slots.get(code_point)
+        if slot is None:
+            return default
+        return None if slot < 0 else self.shift_x[slot]
+
+    def __setitem__(self, code_point: int, glyph: Optional[Glyph]) -> None:
+        if glyph is not None:
+            self.set(
+                code_point,
+                glyph.width,
+                glyph.height,
+                glyph.dx,
+                glyph.dy,
+                glyph.shift_x,
+                glyph.shift_y,
+            )
+            return
+        slot = self._slots.get(code_point, -1)
+        if slot >= 0:
+            self._free.append(slot)
+        self._slots[code_point] = -1
+
+    def __getitem__(self, code_point: int) -> Optional[Glyph]:
+        return self._glyph(self._slots[code_point])
+
+    def __contains__(self, code_point: int) -> bool:
+        return code_point in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get(self, code_point: int, default: Optional[Glyph] = None) -> Optional[Glyph]:
+        """Returns the metrics of ``code_point``, or ``default`` if it is not stored"""
+        slot = self._slots.get(code_point)
+        if slot is None:
+            return default
+        return self._glyph(slot)
+
+    def pop(self, code_point: int, default: Optional[Glyph] = None) -> Optional[Glyph]:
+        """Removes ``code_point`` and returns its metrics, or ``default`` if it is not
+        stored"""
+        slot = self._slots.pop(code_point, None)
+        if slot is None:
+            return default
+        if slot < 0:
+            return None
+        self._free.append(slot)
+        return self._glyph(slot)
+
+    def setdefault(self, code_point: int, default: Optional[Glyph] = None) -> Optional[Glyph]:
+        """Returns the metrics of ``code_point``, storing ``default`` first if it is not
+        stored"""
+        if code_point not in self._slots:
+            self[code_point] = default
+        return self[code_point]
+
+    def items(self) -> Iterator[Tuple[int, Optional[Glyph]]]:
+        """Yields the stored code points and their metrics"""
+        for code_point, slot in self._slots.items():
+            yield code_point, self._glyph(slot)
+
+    def use_code_point_map(self) -> None:
+        """Indexes the entries with a `CodePointMap` instead of a ``dict``"""
+        if isinstance(self._slots, CodePointMap):
+            return
+        slots = CodePointMap()
+        for code_point, slot in self._slots.items():
+            slots[code_point] = slot
+        self._slots = slots
+
+    def clear(self) -> None:
+        """Removes every entry"""
+        self._slots = {} if isinstance(self._slots, dict) else CodePointMap()
+        self._free = []
+        for name in ("width", "height", "dx", "dy", "shift_x", "shift_y"):
+            setattr(self, name, array("h"))
+
+
+class BitmapPool:
+    """Keeps the bitmaps of evicted glyphs so that glyphs of the same size loaded later reuse
+    them instead of allocating new ones.
+
+    Fonts that keep replacing glyphs, for example when switching between screens, otherwise
+    fill the heap with small bitmaps of many sizes until a MemoryError is raised even though
+    plenty of memory is free. Bitmaps are pooled by their width, height and bits per pixel,
+    so monospaced and CJK fonts, whose glyphs mostly share a size, reuse nearly all of them.
+    `GlyphCache.reserve_bitmaps` allocates the bitmaps of given glyphs up front, while the
+    heap is still unfragmented.
+
+    Set it as the ``bitmap_pool`` of a font. Only use it when the bitmaps of evicted glyphs
+    are no longer displayed, because they are cleared and reused for other glyphs.
+
+    :param max_free: The most unused bitmaps to keep. Further evicted bitmaps are left to
+        the garbage collector.
+    """
+
+    def __init__(self, max_free: int = 32) -> None:
+        self.max_free = max_free
+        # (width, height, bits per pixel) to the free bitmaps of that size
+        self._free = {}
+        self._free_count = 0
+        # Bitmaps reused and bitmaps that had to be allocated
+        self.hits = 0
+        self.misses = 0
+
+    def take(self, width: int, height: int, value_count: int) -> Optional[Bitmap]:
+        """Returns a cleared bitmap of the given size, or None when there is none free"""
+        free = self._free.get((width, height, _value_bits(value_count)))
+        if not free:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._free_count -= 1
+        bitmap = free.pop()
+        if hasattr(bitmap, "fill"):
+            bitmap.fill(0)
+        else:
+            for i in range(width * height):
+                bitmap[i] = 0
+        return bitmap
+
+    def give(self, bitmap: Bitmap, value_count: int) -> None:
+        """Adds an unused bitmap that can hold ``value_count`` values to the pool"""
+        if self._free_count >= self.max_free:
+            return
+        key = (bitmap.width, bitmap.height, _value_bits(value_count))
+        free = self._free.setdefault(key, [])
+        for other in free:
+            if other is bitmap:
+                return
+        free.append(bitmap)
+        self._free_count += 1
+
+    def __len__(self) -> int:
+        return self._free_count
+
 
 class GlyphCache:
     """Caches glyphs loaded by a subclass."""
 
+    # Where evicted bitmaps go to be reused, see BitmapPool. Set on the font instance.
+    bitmap_pool = None
+
     def __init__(self) -> None:
+        # Loaded glyphs, and None for code points looked up and found missing. See
+        # use_code_point_map.
         self._glyphs = {}
+        # Metrics-only glyphs whose bitmap is ``None``, see MetricsStore. Entries move to
+        # ``_glyphs`` once their bitmap has been loaded.
+        self._metrics = MetricsStore()
+        self._eviction_listeners = []
+        # The advance shared by every glyph of a monospaced font, set by loaders that can
+        # tell from the font header
+        self.fixed_advance = None
+        self._coverage = None
+        # Code points that a loader has looked up and found missing, so that they are never
+        # looked up again
+        self._missing = CodePointRanges()
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
         """Loads displayio.Glyph objects into the GlyphCache from the font."""
 
+    def coverage(self) -> CodePointRanges:
+        """Returns the code points that the font has glyphs for, without loading any glyphs.
+        The ranges are read from the font once and kept."""
+        if self._coverage is None:
+            self._coverage = self._read_coverage()
+        return self._coverage
+
+    def _read_coverage(self) -> CodePointRanges:
+        """Subclasses override this to list the code points of their font. By default only
+        the glyphs loaded so far are known."""
+        return CodePointRanges.from_code_points(
+            code_point for code_point, glyph in self._glyphs.items() if glyph
+        )
+
+    def has_glyph(self, code_point: int) -> bool:
+        """Returns whether the font has a glyph for ``code_point``, using `coverage`"""
+        return code_point in self.coverage()
+
+    def _load_steps(self, code_points: Union[int, str, Iterable[int]], chunk_size: int):
+        """Loads the glyphs for the given code points, yielding after every ``chunk_size``
+        glyphs. Subclasses override this to yield at finer grained points of their own."""
+        code_points = _to_code_points(code_points)
+
+        for i in range(0, len(code_points), chunk_size):
+            self.load_glyphs(code_points[i : i + chunk_size])
+            yield
+
+    async def load_glyphs_async(
+        self, code_points: Union[int, str, Iterable[int]], chunk_size: int = 8
+    ) -> None:
+        """Loads glyphs like `load_glyphs` while letting other asyncio tasks run.
+
+        Control returns to the event loop after at most ``chunk_size`` glyphs are decoded.
+        Loaders that scan the file, like BDF, also yield periodically while scanning."""
+        import asyncio
+
+        for _ in self._load_steps(code_points, max(chunk_size, 1)):
+            await asyncio.sleep(0)
+
+    async def get_glyphs_async(
+        self, code_points: Union[str, Iterable[int]], chunk_size: int = 8
+    ) -> List[Glyph]:
+        """Loads the given code points with `load_glyphs_async` and returns a list of their
+        Glyphs, with None for unsupported code points."""
+        code_points = _to_code_points(code_points)
+        await self.load_glyphs_async(code_points, chunk_size)
+        return [self._glyphs.get(code_point) for code_point in code_points]
+
+    def load_metrics(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        """Loads the metrics of the given code points without decoding their bitmaps.
+
+        Subclasses that can read metrics cheaply override this. By default the full glyphs
+        are loaded."""
+        self.load_glyphs(code_points)
+
+    def get_metrics(self, code_point: int) -> Glyph:
+        """Returns a Glyph with the metrics for the given code point or None if unsupported.
+
+        The ``bitmap`` of the returned Glyph is ``None`` unless the glyph has already been
+        loaded in full. Use `materialize` or `get_glyph` when the bitmap is needed."""
+        glyph = self._glyphs.get(code_point)
+        if glyph is not None:
+            return glyph
+        if code_point in self._metrics:
+            return self._metrics[code_point]
+
+        self._metrics[code_point] = None
+        self.load_metrics((code_point,))
+        return self._metrics.get(code_point) or self._glyphs.get(code_point)
+
+    def measure(self, text: str) -> int:
+        """Returns the width of ``text`` in pixels, the sum of the advances of its glyphs.
+        Only metrics are loaded. For monospaced fonts this is ``len(text) * fixed_advance``."""
+        if self.fixed_advance is not None:
+            return len(text) * self.fixed_advance
+        self.load_metrics(text)
+        width = 0
+        for char in text:
+            width += self.advance(ord(char)) or 0
+        return width
+
+    def advance(self, code_point: int) -> Optional[int]:
+        """Returns the ``shift_x`` of ``code_point`` or None if unsupported. Like
+        `get_metrics`, but reads the metrics store without creating a Glyph."""
+        glyph = self._glyphs.get(code_point)
+        if glyph is not None:
+            return glyph.shift_x
+        advance = self._metrics.advance(code_point, _ABSENT)
+        if advance is _ABSENT:
+            glyph = self.get_metrics(code_point)
+            return glyph.shift_x if glyph else None
+        return advance
+
+    def _new_bitmap(self, width: int, height: int, value_count: int) -> Bitmap:
+        """Returns a blank bitmap for a glyph, from `bitmap_pool` when it has one"""
+        if self.bitmap_pool is not None:
+            bitmap = self.bitmap_pool.take(width, height, value_count)
+            if bitmap is not None:
+                return bitmap
+        return self.bitmap_class(width, height, value_count)
+
+    def reserve_bitmaps(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        """Allocates bitmaps for the glyphs of ``code_points`` into `bitmap_pool` without
+        loading the glyphs, so that loading them later doesn't allocate. Call it early,
+        before the heap is fragmented. Reserved bitmaps count towards
+        `BitmapPool.max_free`."""
+        code_points = _to_code_points(code_points)
+
+        pool = self.bitmap_pool
+        if pool is None:
+            raise RuntimeError("Set bitmap_pool first")
+        bitmap_class = getattr(self, "bitmap_class", None)
+        if bitmap_class is None:
+            raise TypeError(f"{type(self).__name__} does not decode glyph bitmaps")
+        self.load_metrics(code_points)
+        for code_point in set(code_points):
+            if self._glyphs.get(code_point) is not None:
+                continue
+            metrics = self.get_metrics(code_point)
+            if metrics is not None:
+                value_count = 1 << self._bits_per_value(code_point)
+                pool.give(
+                    self.bitmap_class(metrics.width, metrics.height, value_count), value_count
+                )
+
+    def _bits_per_value(self, code_point: int) -> int:  # noqa: PLR6301
+        """The bits per pixel of the displayio.Bitmap of a glyph. Subclasses with more than
+        two colors override this."""
+        return 1
+
+    def _glyph_memory(self, code_point: int, metrics: Glyph) -> int:
+        if metrics is None:
+            return 0
+        bits = self._bits_per_value(code_point)
+        return _GLYPH_OVERHEAD + _bitmap_bytes(metrics.width, metrics.height, bits)
+
+    def estimate_memory(self, code_points: Union[int, str, Iterable[int]]) -> int:
+        """Returns roughly how many bytes loading the glyphs of ``code_points`` would
+        allocate, worked out from their metrics alone. Glyphs that are already loaded and
+        code points the font doesn't have count as 0."""
+        code_points = _to_code_points(code_points)
+
+        self.load_metrics(code_points)
+        total = 0
+        for code_point in set(code_points):
+            if self._glyphs.get(code_point) is None:
+                total += self._glyph_memory(code_point, self.get_metrics(code_point))
+        return total
+
+    def load_glyphs_within(self, code_points: Union[str, Iterable[int]], budget: int) -> List[int]:
+        """Loads glyphs in the order given, most important first, until the next one would
+        take the estimated memory past ``budget`` bytes. Returns the code points that were
+        deferred, in order.
+
+        ``budget`` is in the same bytes as ``gc.mem_free()``, for example
+        ``gc.mem_free() - 4096`` to leave room for other allocations. The glyphs that fit are
+        loaded as one batch. If memory still runs out, the glyphs of the batch are dropped
+        again before the MemoryError is raised so that none of the batch stays cached.
+        Eviction listeners aren't called for them and their bitmaps don't go to
+        `bitmap_pool`."""
+        code_points = _to_code_points(code_points)
+
+        self.load_metrics(code_points)
+        batch = []
+        queued = set()
+        used = 0
+        deferred = []
+        for code_point in code_points:
+            if code_point in queued or self._glyphs.get(code_point) is not None:
+                continue
+            metrics = self.get_metrics(code_point)
+            if metrics is None:
+                continue
+            queued.add(code_point)
+            size = self._glyph_memory(code_point, metrics)
+            if deferred or used + size > budget:
+                deferred.append(code_point)
+                continue
+            used += size
+            batch.append(code_point)
+
+        if batch:
+            gc.collect()
+            try:
+                self.load_glyphs(batch)
+            except MemoryError:
+                self._discard(batch)
+                gc.collect()
+                raise
+        return deferred
+
+    def materialize(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        """Loads the bitmaps of the given code points, including those previously loaded
+        with `load_metrics`."""
+        self.load_glyphs(code_points)
+
+    def use_code_point_map(self) -> None:
+        """Indexes the cached glyphs and metrics with a `CodePointMap` instead of a ``dict``.
+
+        Each lookup is slower, but the index takes less memory once thousands of glyphs from
+        a few Unicode blocks are cached, as with CJK text on boards with a small heap. Call
+        it before loading the glyphs."""
+        if isinstance(self._glyphs, CodePointMap):
+            return
+        glyphs = CodePointMap()
+        for code_point, glyph in self._glyphs.items():
+            glyphs[code_point] = glyph
+        self._glyphs = glyphs
+        self._metrics.use_code_point_map()
+
     def get_glyph(self, code_point: int) -> Glyph:
         """Returns a displayio.Glyph for the given code point or None is unsupported."""
-        if code_point in self._glyphs:
-            return self._glyphs[code_point]
+        glyph = self._glyphs.get(code_point, _ABSENT)
+        if glyph is not _ABSENT:
+            return glyph
 
         code_points = set()
         code_points.add(code_point)
@@ -55,3 +748,40 @@ class GlyphCache:
         self.load_glyphs(code_points)
         gc.collect()
         return self._glyphs[code_point]
+
+    def evict(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        """Removes the given code points from the cache so that their memory can be reclaimed.
+        They are loaded again the next time they are requested."""
+        code_points = _to_code_points(code_points)
+
+        for code_point in code_points:
+            self._metrics.pop(code_point, None)
+            glyph = self._glyphs.pop(code_point, None)
+            if glyph is not None:
+                for listener in self._eviction_listeners:
+                    listener(self, code_point)
+                self._recycle(code_point, glyph)
+
+    def _discard(self, code_points: List[int]) -> None:
+        """Drops the glyphs of a batch that failed to load. Unlike `evict`, nothing has used
+        them yet, so listeners aren't called and the bitmaps are left to the garbage
+        collector. Fonts that wrap other fonts also discard from the wrapped fonts."""
+        for code_point in code_points:
+            self._metrics.pop(code_point, None)
+            self._glyphs.pop(code_point, None)
+
+    def _recycle(self, code_point: int, glyph: Glyph) -> None:
+        """Gives the bitmap of an evicted glyph to `bitmap_pool`. Fonts that wrap other
+        fonts override this, since the wrapped fonts recycle their own bitmaps."""
+        if self.bitmap_pool is not None and glyph.bitmap is not None:
+            self.bitmap_pool.give(glyph.bitmap, 1 << self._bits_per_value(code_point))
+
+    def add_eviction_listener(self, listener: Callable[["GlyphCache", int], None]) -> None:
+        """Calls ``listener(font, code_point)`` whenever a loaded glyph is evicted."""
+        if listener not in self._eviction_listeners:
+            self._eviction_listeners.append(listener)
+
+    def remove_eviction_listener(self, listener: Callable[["GlyphCache", int], None]) -> None:
+        """Stops calling a listener added with `add_eviction_listener`."""
+        if listener in self._eviction_listeners:
+            self._eviction_listeners.remove(listener)
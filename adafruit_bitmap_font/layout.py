@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.layout`
+====================================================
+
+Wraps text into lines that fit a box using font metrics.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterator, List, Optional, Tuple
+
+    from .glyph_cache import GlyphCache
+except ImportError:
+    pass
+
+from array import array
+
+from .glyph_cache import _bisect_right
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+# Largest x position kept in the array("h") of positions. Only trailing spaces, which hang
+# past the edge of the box, can reach it.
+_MAX_X = 0x7FFF
+
+
+class Layout:
+    """Greedy word-wrapped layout of ``text`` in a box ``width`` pixels wide.
+
+    Lines break after spaces and at ``\\n``. Words wider than the box are broken between
+    characters. Only advances are used, so glyph bitmaps are never loaded; with a
+    `GlyphCache` font the metrics are fetched with `GlyphCache.load_metrics` in one batch.
+
+    Assigning `text` only lays out again from the line before the first changed character,
+    so appending to or editing the end of a long document is cheap.
+
+    :param font: The font to measure with
+    :param int width: The width of the box in pixels
+    :param str text: The initial text
+    :param int line_height: The distance between lines. Defaults to the height of the font's
+        bounding box.
+    """
+
+    def __init__(
+        self,
+        font: GlyphCache,
+        width: int,
+        text: str = "",
+        line_height: Optional[int] = None,
+    ) -> None:
+        self.font = font
+        self.width = width
+        if line_height is None:
+            line_height = font.get_bounding_box()[1]
+        self.line_height = line_height
+        self._advances = {}
+        self._text = ""
+        # Index of the first character of each line and the x position of every character
+        # within its line.
+        self._starts = array("I", [0])
+        self._x = array("h")
+        self.text = text
+
+    @property
+    def text(self) -> str:
+        """The text being laid out. Setting it relays out only the changed suffix."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        old = self._text
+        common = 0
+        limit = min(len(old), len(text))
+        while common < limit and old[common] == text[common]:
+            common += 1
+        if common == len(old) == len(text):
+            return
+        # The break at the end of the previous line depends on the first word of the
+        # changed line, so start one line earlier.
+        line = max(self.line_index(common) - 1, 0)
+        self._text = text
+        self._relayout(line)
+
+    @property
+    def line_count(self) -> int:
+        """The number of lines"""
+        return len(self._starts)
+
+    @property
+    def height(self) -> int:
+        """The height of the laid out text in pixels"""
+        return len(self._starts) * self.line_height
+
+    @property
+    def lines(self) -> List[Tuple[int, int]]:
+        """The ``(start, end)`` character indices of each line. ``end`` excludes the
+        trailing ``\\n`` but includes trailing spaces."""
+        starts = self._starts
+        text = self._text
+        result = []
+        for i, start in enumerate(starts):
+            end = starts[i + 1] if i + 1 < len(starts) else len(text)
+            if end > start and text[end - 1] == "\n":
+                end -= 1
+            result.append((start, end))
+        return result
+
+    def line_index(self, index: int) -> int:
+        """The line that the character at ``index`` is on"""
+        return max(_bisect_right(self._starts, index) - 1, 0)
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """The ``(x, y)`` position of the character at ``index`` relative to the top left
+        of the box"""
+        return self._x[index], self.line_index(index) * self.line_height
+
+    def glyph_positions(
+        self, first_line: int = 0, last_line: Optional[int] = None
+    ) -> Iterator[Tuple[int, int, int]]:
+        """Yields ``(index, x, y)`` for every character on the given lines, skipping
+        newlines"""
+        starts = self._starts
+        text = self._text
+        x_positions = self._x
+        if last_line is None or last_line >= len(starts):
+            last_line = len(starts) - 1
+        for line in range(first_line, last_line + 1):
+            y = line * self.line_height
+            end = starts[line + 1] if line + 1 < len(starts) else len(text)
+            for index in range(starts[line], end):
+                if text[index] != "\n":
+                    yield index, x_positions[index], y
+
+    def _advance_lookup(self, text: str):
+        advances = self._advances
+        missing = list(set(ord(c) for c in text if c not in advances))
+        if not missing:
+            return advances
+        font = self.font
+        if hasattr(font, "load_metrics"):
+            font.load_metrics(missing)
+            for code_point in missing:
+                advances[chr(code_point)] = font.advance(code_point) or 0
+            return advances
+        for code_point in missing:
+            glyph = font.get_glyph(code_point)
+            advances[chr(code_point)] = glyph.shift_x if glyph else 0
+        return advances
+
+    def _relayout(self, line: int) -> None:
+        text = self._text
+        start = self._starts[line]
+        starts = self._starts[: line + 1]
+        x_positions = self._x[:start]
+        # Monospaced fonts don't need any metrics
+        fixed_advance = getattr(self.font, "fixed_advance", None)
+        if fixed_advance is None:
+            advances = self._advance_lookup(text[start:])
+        width = self.width
+
+        line_start = start
+        # Index just after the last space on the current line, where it may be broken
+        break_at = -1
+        x = 0
+        i = start
+        n = len(text)
+        while i < n:
+            char = text[i]
+            if char == "\n":
+                x_positions.append(min(x, _MAX_X))
+                i += 1
+                starts.append(i)
+                line_start = i
+                break_at = -1
+                x = 0
+                continue
+            advance = fixed_advance if fixed_advance is not None else advances[char]
+            if char == " ":
+                # Trailing spaces may hang past the edge of the box.
+                x_positions.append(min(x, _MAX_X))
+                x += advance
+                i += 1
+                break_at = i
+                continue
+            if x + advance > width and i > line_start:
+                if break_at > line_start:
+                    # Move the partial word after the last space down to a new line.
+                    shift = x_positions[break_at] if break_at < i else x
+                    for k in range(break_at, i):
+                        x_positions[k] -= shift
+                    x -= shift
+                    line_start = break_at
+                else:
+                    x = 0
+                    line_start = i
+                starts.append(line_start)
+                break_at = -1
+                continue
+            x_positions.append(x)
+            x += advance
+            i += 1
+
+        self._starts = starts
+        self._x = x_positions
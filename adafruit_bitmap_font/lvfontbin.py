@@ -32,7 +32,7 @@ except ImportError:
 
 from fontio import Glyph
 
-from .glyph_cache import GlyphCache
+from .glyph_cache import CodePointRanges, GlyphCache, _to_code_points, _value_bits
 
 
 class LVGLFont(GlyphCache):
@@ -111,6 +111,9 @@ class LVGLFont(GlyphCache):
         self._glyph_bbox_xy_bits = data[30]
         self._glyph_bbox_wh_bits = data[31]
         self._glyph_advance_bits = data[32]
+        # Glyphs without an advance field all use the default advance
+        if self._glyph_advance_bits == 0:
+            self.fixed_advance = self._default_advance_width
         self._glyph_header_bits = (
             self._glyph_advance_bits + 2 * self._glyph_bbox_xy_bits + 2 * self._glyph_bbox_wh_bits
         )
@@ -153,6 +156,30 @@ class LVGLFont(GlyphCache):
             }
             self._cmap_subtables.append(subtable_info)
 
+    def _read_coverage(self) -> CodePointRanges:
+        # Only the subtable formats that _load_glyphs can look up
+        code_points = []
+        for subtable in self._cmap_subtables:
+            format_type = subtable["format"]
+            range_start = subtable["range_start"]
+            glyph_offset = subtable["glyph_offset"]
+            entries_count = subtable["entries_count"]
+            if format_type == 0:
+                self.file.seek(subtable["data_offset"])
+                glyph_ids = self.file.read(entries_count)
+                for i in range(min(entries_count, subtable["range_length"])):
+                    if glyph_ids[i] + glyph_offset < self._max_cid:
+                        code_points.append(range_start + i)
+            elif format_type == 2:
+                stop = min(subtable["range_length"], self._max_cid - glyph_offset)
+                code_points.extend(range(range_start, range_start + stop))
+            elif format_type == 3:
+                self.file.seek(subtable["data_offset"])
+                offsets = self.file.read(entries_count * 2)
+                for i in range(min(entries_count, self._max_cid - glyph_offset)):
+                    code_points.append(range_start + struct.unpack_from("<H", offsets, 2 * i)[0])
+        return CodePointRanges.from_code_points(code_points)
+
     @property
     def ascent(self) -> int:
         """The number of pixels above the baseline of a typical ascender"""
@@ -167,6 +194,9 @@ class LVGLFont(GlyphCache):
         """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
         return (self._width, self._height, self._x_offset, self._y_offset)
 
+    def _bits_per_value(self, code_point: int) -> int:
+        return _value_bits(1 << self._bits_per_pixel)
+
     def _seek(self, offset):
         self.file.seek(offset)
         self._byte = 0
@@ -188,14 +218,29 @@ class LVGLFont(GlyphCache):
         return result
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        self._load_glyphs(code_points, False)
+
+    def load_metrics(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        self._load_glyphs(code_points, True)
+
+    def _load_glyphs(self, code_points: Union[int, str, Iterable[int]], metrics_only: bool) -> None:
         # pylint: disable=too-many-statements,too-many-branches,too-many-nested-blocks,too-many-locals
-        if isinstance(code_points, int):
-            code_points = (code_points,)
-        elif isinstance(code_points, str):
-            code_points = [ord(c) for c in code_points]
+        code_points = _to_code_points(code_points)
 
         # Only load glyphs that aren't already cached
-        code_points = sorted(c for c in code_points if self._glyphs.get(c, None) is None)
+        missing = self._missing
+        if metrics_only:
+            code_points = sorted(
+                c
+                for c in code_points
+                if self._glyphs.get(c, None) is None
+                and self._metrics.get(c, None) is None
+                and c not in missing
+            )
+        else:
+            code_points = sorted(
+                c for c in code_points if self._glyphs.get(c, None) is None and c not in missing
+            )
         if not code_points:
             return
 
@@ -236,7 +281,11 @@ class LVGLFont(GlyphCache):
                             break
 
             if cid is None or cid >= self._max_cid:
-                self._glyphs[code_point] = None
+                missing.add(code_point)
+                if metrics_only:
+                    self._metrics[code_point] = None
+                else:
+                    self._glyphs[code_point] = None
                 continue
 
             offset_length = 4 if self._index_to_loc_format == 1 else 2
@@ -249,7 +298,10 @@ class LVGLFont(GlyphCache):
 
             # Read glyph header data
             self._seek(self._glyf_start + glyph_offset)
-            glyph_advance = self._read_bits(self._glyph_advance_bits)
+            if self._glyph_advance_bits:
+                glyph_advance = self._read_bits(self._glyph_advance_bits)
+            else:
+                glyph_advance = self._default_advance_width
 
             # Read and convert signed bbox_x and bbox_y
             bbox_x = self._read_bits(self._glyph_bbox_xy_bits)
@@ -265,8 +317,12 @@ class LVGLFont(GlyphCache):
             bbox_w = self._read_bits(self._glyph_bbox_wh_bits)
             bbox_h = self._read_bits(self._glyph_bbox_wh_bits)
 
+            if metrics_only:
+                self._metrics.set(code_point, bbox_w, bbox_h, bbox_x, bbox_y, glyph_advance, 0)
+                continue
+
             # Create bitmap for the glyph
-            bitmap = self.bitmap_class(bbox_w, bbox_h, 2**self._bits_per_pixel)
+            bitmap = self._new_bitmap(bbox_w, bbox_h, 2**self._bits_per_pixel)
 
             # Read bitmap data (starting from the current bit position)
             for y in range(bbox_h):
@@ -279,3 +335,4 @@ class LVGLFont(GlyphCache):
             self._glyphs[code_point] = Glyph(
                 bitmap, 0, bbox_w, bbox_h, bbox_x, bbox_y, glyph_advance, 0
             )
+            self._metrics.pop(code_point, None)
@@ -24,7 +24,7 @@ Implementation Notes
 
 try:
     from io import FileIO
-    from typing import Iterable, Iterator, Tuple, Union
+    from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
     from displayio import Bitmap as displayioBitmap
 except ImportError:
@@ -32,12 +32,13 @@ except ImportError:
 
 import gc
 import struct
+from array import array
 from collections import namedtuple
 
 from fontio import Glyph
 from micropython import const
 
-from .glyph_cache import GlyphCache
+from .glyph_cache import CodePointRanges, GlyphCache, _to_code_points
 
 try:
     from bitmaptools import readinto as _bitmap_readinto
@@ -54,6 +55,13 @@ _PCF_SWIDTHS = const(1 << 6)
 _PCF_GLYPH_NAMES = const(1 << 7)
 _PCF_BDF_ACCELERATORS = const(1 << 8)
 
+# Code point of the glyphs that the encoding table leaves out, in the glyph name index. It
+# is too large for const() on 32 bit boards.
+_UNENCODED = 0xFFFFFFFF
+
+# Bitmap offsets read at a time when checking for a fixed stride
+_OFFSET_CHUNK = const(64)
+
 _PCF_DEFAULT_FORMAT = const(0x00000000)
 _PCF_ACCEL_W_INKBOUNDS = const(0x00000100)
 _PCF_COMPRESSED_METRICS = const(0x00000100)
@@ -103,14 +111,25 @@ Bitmap = namedtuple("Bitmap", ("glyph_count", "bitmap_sizes"))
 
 
 class PCF(GlyphCache):
-    """Loads glyphs from a PCF file in the given bitmap_class."""
+    """Loads glyphs from a PCF file in the given bitmap_class.
+
+    Glyphs are loaded table by table in file order. Nearby entries are read together when
+    no more than `read_gap` bytes separate them, in reads of up to `max_read` bytes.
+    """
 
     def __init__(self, f: FileIO, bitmap_class: displayioBitmap) -> None:
         super().__init__()
         self.file = f
+        # The unbuffered file under a BlockReader, for bitmaptools.readinto
+        self._raw_file = getattr(f, "raw", f)
+        # Bytes that may be skipped to merge two reads into one, and the largest merged read
+        self.read_gap = 64
+        self.max_read = 1024
         self.name = f
         f.seek(0)
         self.buffer = bytearray(1)
+        # Buffer backed files unpack in place
+        self._unpack = getattr(f, "unpack", None)
         self.bitmap_class = bitmap_class
         _, table_count = self._read("<4sI")
         self.tables = {}
@@ -118,9 +137,23 @@ class PCF(GlyphCache):
             type_, format_, size, offset = self._read("<IIII")
             self.tables[type_] = Table(format_, size, offset)
 
+        # Bitmap rows are padded to 1, 2, 4 or 8 bytes. Bits are stored most or least
+        # significant first, and bytes are swapped within each scan unit of 1, 2 or 4 bytes
+        # when the byte order differs from the bit order.
         bitmap_format = self.tables[_PCF_BITMAPS].format
-        if bitmap_format != 0xE:
-            raise NotImplementedError(f"Unsupported format {bitmap_format}")
+        self._row_pad = 1 << (bitmap_format & _PCF_GLYPH_PAD_MASK)
+        self._msb_first = bool(bitmap_format & _PCF_BIT_MASK)
+        self._swap_unit = 1
+        if bool(bitmap_format & _PCF_BYTE_MASK) != self._msb_first:
+            self._swap_unit = 1 << ((bitmap_format & _PCF_SCAN_UNIT_MASK) >> 4)
+        # The layout of format 0xE, which bitmaptools.readinto can read directly from native
+        # files
+        self._readinto_layout = (
+            self._row_pad == 4
+            and self._msb_first
+            and self._swap_unit == 1
+            and getattr(self._raw_file, "native", True)
+        )
 
         self._accel = self._read_accelerator_tables()
         self._encoding = self._read_encoding_table()
@@ -128,6 +161,22 @@ class PCF(GlyphCache):
 
         self._ascent = self._accel.font_ascent
         self._descent = self._accel.font_descent
+        # Read on first use
+        self._properties = None
+        self._name_offsets = None
+        self._name_code_points = None
+
+        # Terminal style fonts whose glyphs all have the same metrics share one record and
+        # usually store their bitmaps at a fixed stride
+        minbounds = self._accel.minbounds
+        maxbounds = self._accel.maxbounds
+        self._constant_metrics = None
+        self._bitmap_stride = None
+        if self._accel.constant_metrics and minbounds == maxbounds:
+            self._constant_metrics = minbounds
+            self._bitmap_stride = self._read_bitmap_stride(minbounds)
+        if minbounds.character_width == maxbounds.character_width:
+            self.fixed_advance = maxbounds.character_width
 
         minbounds = self._accel.ink_minbounds
         maxbounds = self._accel.ink_maxbounds
@@ -156,6 +205,8 @@ class PCF(GlyphCache):
         return self._bounding_box
 
     def _read(self, format_: str) -> Tuple:
+        if self._unpack:
+            return self._unpack(format_)
         size = struct.calcsize(format_)
         if size != len(self.buffer):
             self.buffer = bytearray(size)
@@ -165,28 +216,83 @@ class PCF(GlyphCache):
     def _seek_table(self, table: Table) -> int:
         self.file.seek(table.offset)
         (format_,) = self._read("<I")
+        return format_
 
-        if format_ & _PCF_BYTE_MASK == 0:
-            raise RuntimeError("Only big endian supported")
+    def _byte_order(self, type_: int) -> str:
+        """The struct byte order prefix of the numbers in a table"""
+        return ">" if self.tables[type_].format & _PCF_BYTE_MASK else "<"
 
-        return format_
+    def _row_size(self, width: int) -> int:
+        """The size of one padded bitmap row"""
+        bits = 8 * self._row_pad
+        return (width + bits - 1) // bits * self._row_pad
 
     def _read_encoding_table(self) -> Encoding:
         encoding = self.tables[_PCF_BDF_ENCODINGS]
         self._seek_table(encoding)
 
-        return Encoding(*self._read(">hhhhh"))
+        return Encoding(*self._read(self._byte_order(_PCF_BDF_ENCODINGS) + "hhhhh"))
+
+    def _read_coverage(self) -> CodePointRanges:
+        encoding = self._encoding
+        columns = encoding.max_byte2 - encoding.min_byte2 + 1
+        row = bytearray(2 * columns)
+        ranges = CodePointRanges()
+        self.file.seek(self.tables[_PCF_BDF_ENCODINGS].offset + 14)
+        # One row of the encoding table at a time, as runs of present glyphs
+        for byte1 in range(encoding.min_byte1, encoding.max_byte1 + 1):
+            self.file.readinto(row)
+            first = (byte1 << 8) + encoding.min_byte2
+            start = None
+            for i in range(columns):
+                if row[2 * i] == 0xFF and row[2 * i + 1] == 0xFF:
+                    if start is not None:
+                        ranges.add_range(first + start, first + i)
+                        start = None
+                elif start is None:
+                    start = i
+            if start is not None:
+                ranges.add_range(first + start, first + columns)
+        return ranges
 
     def _read_bitmap_table(self) -> Bitmap:
         bitmaps = self.tables[_PCF_BITMAPS]
         format_ = self._seek_table(bitmaps)
 
-        (glyph_count,) = self._read(">I")
+        order = self._byte_order(_PCF_BITMAPS)
+        (glyph_count,) = self._read(order + "I")
         self.file.seek(bitmaps.offset + 8 + 4 * glyph_count)
-        bitmap_sizes = self._read(">4I")
+        bitmap_sizes = self._read(order + "4I")
         return Bitmap(glyph_count, bitmap_sizes[format_ & 3])
 
-    def _read_metrics(self, compressed_metrics: bool) -> Metrics:
+    def _read_bitmap_stride(self, metrics: Metrics) -> Optional[int]:
+        """Returns the size of every glyph's bitmap if they are stored back to back in glyph
+        order, which lets their offsets be computed instead of read. Every offset is checked
+        once, when the font is opened."""
+        width = metrics.right_side_bearing - metrics.left_side_bearing
+        height = metrics.character_ascent + metrics.character_descent
+        stride = self._row_size(width) * height
+        count = self._bitmaps.glyph_count
+        if count < 2:
+            return None
+        order = self._byte_order(_PCF_BITMAPS)
+        self.file.seek(self.tables[_PCF_BITMAPS].offset + 8)
+        offset = 0
+        for start in range(0, count, _OFFSET_CHUNK):
+            chunk = min(count - start, _OFFSET_CHUNK)
+            for value in self._read(f"{order}{chunk}I"):
+                if value != offset:
+                    return None
+                offset += stride
+        return stride
+
+    def _read_metrics(self, compressed_metrics: bool, order: str) -> Metrics:
+        return self._make_metrics(
+            self._read("5B" if compressed_metrics else order + "5hH"), compressed_metrics
+        )
+
+    @staticmethod
+    def _make_metrics(values: Tuple, compressed_metrics: bool) -> Metrics:
         if compressed_metrics:
             (
                 left_side_bearing,
@@ -194,7 +300,7 @@ class PCF(GlyphCache):
                 character_width,
                 character_ascent,
                 character_descent,
-            ) = self._read("5B")
+            ) = values
             left_side_bearing -= 0x80
             right_side_bearing -= 0x80
             character_width -= 0x80
@@ -209,7 +315,7 @@ class PCF(GlyphCache):
                 character_ascent,
                 character_descent,
                 attributes,
-            ) = self._read(">5hH")
+            ) = values
         return Metrics(
             left_side_bearing,
             right_side_bearing,
@@ -228,6 +334,7 @@ class PCF(GlyphCache):
 
         format_ = self._seek_table(accelerators)
         has_inkbounds = format_ & _PCF_ACCEL_W_INKBOUNDS
+        order = ">" if format_ & _PCF_BYTE_MASK else "<"
 
         (
             no_overlap,
@@ -241,12 +348,12 @@ class PCF(GlyphCache):
             font_ascent,
             font_descent,
             max_overlap,
-        ) = self._read(">BBBBBBBBIII")
-        minbounds = self._read_metrics(False)
-        maxbounds = self._read_metrics(False)
+        ) = self._read(order + "BBBBBBBBiii")
+        minbounds = self._read_metrics(False, order)
+        maxbounds = self._read_metrics(False, order)
         if has_inkbounds:
-            ink_minbounds = self._read_metrics(False)
-            ink_maxbounds = self._read_metrics(False)
+            ink_minbounds = self._read_metrics(False, order)
+            ink_maxbounds = self._read_metrics(False, order)
         else:
             ink_minbounds = minbounds
             ink_maxbounds = maxbounds
@@ -269,19 +376,16 @@ class PCF(GlyphCache):
         )
 
     def _read_properties(self) -> Iterator[Tuple[bytes, Union[bytes, int]]]:
-        property_table_offset = self.tables[_PCF_PROPERTIES]["offset"]
-        self.file.seek(property_table_offset)
-        (format_,) = self._read("<I")
-
-        if format_ & _PCF_BYTE_MASK == 0:
-            raise RuntimeError("Only big endian supported")
-        (nprops,) = self._read(">I")
-        self.file.seek(property_table_offset + 8 + 9 * nprops)
-
-        pos = self.file.tell()
-        if pos % 4 > 0:
-            self.file.read(4 - pos % 4)
-        (string_size,) = self._read(">I")
+        table = self.tables.get(_PCF_PROPERTIES)
+        if not table:
+            return
+        order = self._byte_order(_PCF_PROPERTIES)
+        self.file.seek(table.offset + 4)
+        (nprops,) = self._read(order + "I")
+        # The 9 byte property records are padded to a multiple of 4
+        strings_offset = table.offset + 8 + (9 * nprops + 3) // 4 * 4
+        self.file.seek(strings_offset)
+        (string_size,) = self._read(order + "I")
 
         strings = self.file.read(string_size)
         string_map = {}
@@ -290,118 +394,329 @@ class PCF(GlyphCache):
             string_map[i] = value
             i += len(value) + 1
 
-        self.file.seek(property_table_offset + 8)
+        self.file.seek(table.offset + 8)
         for _ in range(nprops):
-            name_offset, is_string_prop, value = self._read(">IBI")
+            name_offset, is_string_prop, value = self._read(order + "IBi")
 
             if is_string_prop:
                 yield (string_map[name_offset], string_map[value])
             else:
                 yield (string_map[name_offset], value)
 
-    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
-        if isinstance(code_points, int):
-            code_points = (code_points,)
-        elif isinstance(code_points, str):
-            code_points = [ord(c) for c in code_points]
+    @property
+    def properties(self) -> Dict[str, Union[str, int]]:
+        """The font properties, such as ``FONT_ASCENT`` and ``PIXEL_SIZE``, by name. They are
+        read from the file the first time they are used."""
+        if self._properties is None:
+            self._properties = {
+                name.decode("utf-8"): value.decode("utf-8") if isinstance(value, bytes) else value
+                for name, value in self._read_properties()
+            }
+        return self._properties
+
+    def _glyph_index(self, code_point: int) -> Optional[int]:
+        """The index of the glyph for ``code_point`` in the glyph tables, or None"""
+        encoding = self._encoding
+        enc1 = code_point >> 8
+        enc2 = code_point & 0xFF
+        if enc1 < encoding.min_byte1 or enc1 > encoding.max_byte1:
+            return None
+        if enc2 < encoding.min_byte2 or enc2 > encoding.max_byte2:
+            return None
+        encoding_idx = (enc1 - encoding.min_byte1) * (
+            encoding.max_byte2 - encoding.min_byte2 + 1
+        ) + (enc2 - encoding.min_byte2)
+        self.file.seek(self.tables[_PCF_BDF_ENCODINGS].offset + 14 + 2 * encoding_idx)
+        (glyph_idx,) = self._read(self._byte_order(_PCF_BDF_ENCODINGS) + "H")
+        if glyph_idx == 0xFFFF:
+            return None
+        return glyph_idx
+
+    def get_ink_metrics(self, code_point: int) -> Optional[Metrics]:
+        """Returns the Metrics of the inked pixels of a glyph, which may be smaller than its
+        bitmap, or None when the font has no ink metrics or no such glyph."""
+        table = self.tables.get(_PCF_INK_METRICS)
+        index = self._glyph_index(code_point)
+        if not table or index is None:
+            return None
+        compressed = table.format & _PCF_COMPRESSED_METRICS
+        if compressed:
+            self.file.seek(table.offset + 6 + 5 * index)
+        else:
+            self.file.seek(table.offset + 8 + 12 * index)
+        return self._read_metrics(compressed, self._byte_order(_PCF_INK_METRICS))
+
+    def get_swidth(self, code_point: int) -> Optional[int]:
+        """Returns the scalable width of a glyph in thousandths of the point size, or None
+        when the font has no scalable widths or no such glyph."""
+        table = self.tables.get(_PCF_SWIDTHS)
+        index = self._glyph_index(code_point)
+        if not table or index is None:
+            return None
+        self.file.seek(table.offset + 8 + 4 * index)
+        (swidth,) = self._read(self._byte_order(_PCF_SWIDTHS) + "i")
+        return swidth
+
+    def _read_name(self, name_offset: int) -> bytes:
+        table = self.tables[_PCF_GLYPH_NAMES]
+        self.file.seek(table.offset + 12 + 4 * self._bitmaps.glyph_count + name_offset)
+        name = b""
+        while True:
+            chunk = self.file.read(32)
+            end = chunk.find(b"\x00")
+            if end >= 0 or not chunk:
+                return name + chunk[: max(end, 0)]
+            name += chunk
+
+    def _glyph_name_offset(self, index: int) -> int:
+        self.file.seek(self.tables[_PCF_GLYPH_NAMES].offset + 8 + 4 * index)
+        (name_offset,) = self._read(self._byte_order(_PCF_GLYPH_NAMES) + "I")
+        return name_offset
+
+    def glyph_name(self, code_point: int) -> Optional[str]:
+        """Returns the name of the glyph for ``code_point``, or None when the font has no
+        glyph names or no such glyph."""
+        index = self._glyph_index(code_point)
+        if _PCF_GLYPH_NAMES not in self.tables or index is None:
+            return None
+        return self._read_name(self._glyph_name_offset(index)).decode("utf-8")
+
+    def _build_name_index(self) -> None:
+        """Sorts the glyph names once, keeping only their offsets and the code points"""
+        table = self.tables[_PCF_GLYPH_NAMES]
+        count = self._bitmaps.glyph_count
+        order = self._byte_order(_PCF_GLYPH_NAMES)
+        self.file.seek(table.offset + 8)
+        name_offsets = struct.unpack(f"{order}{count}I", self.file.read(4 * count))
+        self.file.seek(table.offset + 8 + 4 * count)
+        (string_size,) = self._read(order + "I")
+        strings = self.file.read(string_size)
 
-        code_points = sorted(c for c in code_points if self._glyphs.get(c, None) is None)
+        def name(index: int) -> bytes:
+            start = name_offsets[index]
+            return strings[start : strings.find(b"\x00", start)]
+
+        # Glyph index to code point, from the encoding table. Glyphs that it leaves out keep
+        # the _UNENCODED sentinel.
+        code_points = array("I", b"\xff" * (4 * count))
+        for code_point in self.coverage():
+            index = self._glyph_index(code_point)
+            if index is not None and index < count:
+                code_points[index] = code_point
+        sorted_indices = sorted(range(count), key=name)
+        self._name_offsets = array("I", (name_offsets[i] for i in sorted_indices))
+        self._name_code_points = array("I", (code_points[i] for i in sorted_indices))
+
+    def code_point_for_name(self, name: str) -> Optional[int]:
+        """Returns the code point of the glyph called ``name``, or None. The names are sorted
+        once, after which each lookup is a binary search that reads a few names from the
+        file."""
+        if _PCF_GLYPH_NAMES not in self.tables:
+            return None
+        if self._name_offsets is None:
+            self._build_name_index()
+        name = name.encode("utf-8")
+        offsets = self._name_offsets
+        lo = 0
+        hi = len(offsets)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._read_name(offsets[mid]) < name:
+                lo = mid + 1
+            else:
+                hi = mid
+        # Several glyphs can share a name, and some of them may not be encoded
+        while lo < len(offsets) and self._read_name(offsets[lo]) == name:
+            code_point = self._name_code_points[lo]
+            if code_point != _UNENCODED:
+                return code_point
+            lo += 1
+        return None
+
+    def _read_spans(self, spans: List[Tuple[int, int, int]]) -> Iterator[Tuple[int, bytes, int]]:
+        """Reads the ``(offset, size, key)`` spans, sorted by offset, and yields the key, the
+        data read and the start of the span in it for each one. Spans separated by no more
+        than `read_gap` bytes are read together, up to `max_read` bytes at a time."""
+        run = []
+        run_start = run_end = 0
+        for span in spans:
+            offset, size, _ = span
+            if (
+                run
+                and offset - run_end <= self.read_gap
+                and offset + size - run_start <= self.max_read
+            ):
+                run.append(span)
+                run_end = max(run_end, offset + size)
+                continue
+            if run:
+                yield from self._read_run(run, run_start, run_end)
+            run = [span]
+            run_start = offset
+            run_end = offset + size
+        if run:
+            yield from self._read_run(run, run_start, run_end)
+
+    def _read_run(
+        self, run: List[Tuple[int, int, int]], run_start: int, run_end: int
+    ) -> Iterator[Tuple[int, bytes, int]]:
+        self.file.seek(run_start)
+        data = self.file.read(run_end - run_start)
+        for offset, _, key in run:
+            yield key, data, offset - run_start
+
+    def _decode_bitmap(
+        self, bitmap: displayioBitmap, width: int, height: int, data: bytes, offset: int
+    ) -> None:
+        """Decodes a glyph bitmap starting at ``offset`` in ``data`` with a loop specialized
+        for the bit order of the font"""
+        row_size = self._row_size(width)
+        buf = bytearray(row_size)
+        swap_unit = self._swap_unit
+        start = 0
+        for _ in range(height):
+            buf[:] = data[offset : offset + row_size]
+            offset += row_size
+            if swap_unit > 1:
+                for i in range(0, len(buf), swap_unit):
+                    buf[i : i + swap_unit] = bytes(reversed(buf[i : i + swap_unit]))
+            if self._msb_first:
+                for k in range(width):
+                    if buf[k // 8] & (128 >> (k % 8)):
+                        bitmap[start + k] = 1
+            else:
+                for k in range(width):
+                    if buf[k // 8] & (1 << (k % 8)):
+                        bitmap[start + k] = 1
+            start += width
+
+    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        self._load_glyphs(code_points, False)
+
+    def load_metrics(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        self._load_glyphs(code_points, True)
+
+    def _load_glyphs(self, code_points: Union[int, str, Iterable[int]], metrics_only: bool) -> None:
+        code_points = _to_code_points(code_points)
+
+        missing = self._missing
+        if metrics_only:
+            code_points = sorted(
+                c
+                for c in code_points
+                if self._glyphs.get(c, None) is None
+                and self._metrics.get(c, None) is None
+                and c not in missing
+            )
+        else:
+            code_points = sorted(
+                c for c in code_points if self._glyphs.get(c, None) is None and c not in missing
+            )
         if not code_points:
             return
 
-        indices_offset = self.tables[_PCF_BDF_ENCODINGS].offset + 14
         bitmap_offset_offsets = self.tables[_PCF_BITMAPS].offset + 8
         first_bitmap_offset = self.tables[_PCF_BITMAPS].offset + 4 * (6 + self._bitmaps.glyph_count)
         metrics_compressed = self.tables[_PCF_METRICS].format & _PCF_COMPRESSED_METRICS
         first_metric_offset = self.tables[_PCF_METRICS].offset + (6 if metrics_compressed else 8)
         metrics_size = 5 if metrics_compressed else 12
+        metrics_order = self._byte_order(_PCF_METRICS)
 
-        # These will each _tend to be_ forward reads in the file, at least
-        # sometimes we'll benefit from oofatfs's 512 byte cache and avoid
-        # excess reads
         indices = [None] * len(code_points)
         for i, code_point in enumerate(code_points):
-            enc1 = (code_point >> 8) & 0xFF
-            enc2 = code_point & 0xFF
-
-            if enc1 < self._encoding.min_byte1 or enc1 > self._encoding.max_byte1:
-                continue
-            if enc2 < self._encoding.min_byte2 or enc2 > self._encoding.max_byte2:
-                continue
-
-            encoding_idx = (
-                (enc1 - self._encoding.min_byte1)
-                * (self._encoding.max_byte2 - self._encoding.min_byte2 + 1)
-                + enc2
-                - self._encoding.min_byte2
-            )
-            self.file.seek(indices_offset + 2 * encoding_idx)
-            (glyph_idx,) = self._read(">H")
-            if glyph_idx != 65535:
+            glyph_idx = self._glyph_index(code_point)
+            if glyph_idx is not None:
                 indices[i] = glyph_idx
+            else:
+                missing.add(code_point)
+        # The tables are ordered by glyph index rather than code point, so each table is
+        # read in glyph order to keep the reads moving forward through the file
+        found = sorted(
+            (i for i in range(len(code_points)) if indices[i] is not None), key=indices.__getitem__
+        )
 
         all_metrics = [None] * len(code_points)
-        for i, code_point in enumerate(code_points):
-            index = indices[i]
-            if index is None:
-                continue
-            self.file.seek(first_metric_offset + metrics_size * index)
-            all_metrics[i] = self._read_metrics(metrics_compressed)
-        bitmap_offsets = [None] * len(code_points)
-        for i, code_point in enumerate(code_points):
-            index = indices[i]
-            if index is None:
-                continue
-            self.file.seek(bitmap_offset_offsets + 4 * index)
-            (bitmap_offset,) = self._read(">I")
-            bitmap_offsets[i] = bitmap_offset
+        constant_metrics = self._constant_metrics
+        if constant_metrics:
+            for i in found:
+                all_metrics[i] = constant_metrics
+        else:
+            metrics_format = "5B" if metrics_compressed else metrics_order + "5hH"
+            spans = [
+                (first_metric_offset + metrics_size * indices[i], metrics_size, i) for i in found
+            ]
+            for i, data, start in self._read_spans(spans):
+                all_metrics[i] = self._make_metrics(
+                    struct.unpack_from(metrics_format, data, start), metrics_compressed
+                )
 
-        # Batch creation of glyphs and bitmaps so that we need only gc.collect
-        # once
-        gc.collect()
-        bitmaps = [None] * len(code_points)
-        for i in range(len(all_metrics)):
-            metrics = all_metrics[i]
-            if metrics is not None:
-                width = metrics.right_side_bearing - metrics.left_side_bearing
-                height = metrics.character_ascent + metrics.character_descent
-                bitmap = bitmaps[i] = self.bitmap_class(width, height, 2)
-                self._glyphs[code_points[i]] = Glyph(
-                    bitmap,
-                    0,
-                    width,
-                    height,
+        if metrics_only:
+            for i in found:
+                metrics = all_metrics[i]
+                self._metrics.set(
+                    code_points[i],
+                    metrics.right_side_bearing - metrics.left_side_bearing,
+                    metrics.character_ascent + metrics.character_descent,
                     metrics.left_side_bearing,
                     -metrics.character_descent,
                     metrics.character_width,
                     0,
                 )
+            return
 
-        for i, code_point in enumerate(code_points):
+        bitmap_offsets = [None] * len(code_points)
+        if self._bitmap_stride is not None:
+            for i in found:
+                bitmap_offsets[i] = indices[i] * self._bitmap_stride
+        else:
+            offset_order = self._byte_order(_PCF_BITMAPS) + "I"
+            spans = [(bitmap_offset_offsets + 4 * indices[i], 4, i) for i in found]
+            for i, data, start in self._read_spans(spans):
+                (bitmap_offsets[i],) = struct.unpack_from(offset_order, data, start)
+
+        # Batch creation of glyphs and bitmaps so that we need only gc.collect
+        # once. They are only added to the cache once all of them are loaded, so running out
+        # of memory part way leaves the cache as it was.
+        gc.collect()
+        bitmaps = [None] * len(code_points)
+        glyphs = [None] * len(code_points)
+        for i in found:
             metrics = all_metrics[i]
-            if metrics is None:
-                continue
-            self.file.seek(first_bitmap_offset + bitmap_offsets[i])
             width = metrics.right_side_bearing - metrics.left_side_bearing
             height = metrics.character_ascent + metrics.character_descent
+            bitmap = bitmaps[i] = self._new_bitmap(width, height, 2)
+            glyphs[i] = Glyph(
+                bitmap,
+                0,
+                width,
+                height,
+                metrics.left_side_bearing,
+                -metrics.character_descent,
+                metrics.character_width,
+                0,
+            )
 
-            bitmap = bitmaps[i]
-
-            if _bitmap_readinto:
+        # Bitmaps are usually stored in glyph order too, but only their offsets tell
+        found.sort(key=bitmap_offsets.__getitem__)
+        if _bitmap_readinto and self._readinto_layout:
+            for i in found:
+                self._raw_file.seek(first_bitmap_offset + bitmap_offsets[i])
                 _bitmap_readinto(
-                    bitmap,
-                    self.file,
+                    bitmaps[i],
+                    self._raw_file,
                     bits_per_pixel=1,
                     element_size=4,
                     reverse_pixels_in_element=True,
                 )
-            else:
-                words_per_row = (width + 31) // 32
-                buf = bytearray(4 * words_per_row)
-                start = 0
-                for _ in range(height):
-                    self.file.readinto(buf)
-                    for k in range(width):
-                        if buf[k // 8] & (128 >> (k % 8)):
-                            bitmap[start + k] = 1
-                    start += width
+        else:
+            spans = []
+            for i in found:
+                size = self._row_size(glyphs[i].width) * glyphs[i].height
+                spans.append((first_bitmap_offset + bitmap_offsets[i], size, i))
+            for i, data, start in self._read_spans(spans):
+                glyph = glyphs[i]
+                self._decode_bitmap(bitmaps[i], glyph.width, glyph.height, data, start)
+
+        for i in found:
+            self._glyphs[code_points[i]] = glyphs[i]
+            self._metrics.pop(code_points[i], None)
@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.render`
+====================================================
+
+Draws text directly into a Bitmap.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Optional, Sequence, Tuple
+
+    from displayio import Bitmap
+
+    from .glyph_cache import GlyphCache
+except ImportError:
+    pass
+
+try:
+    from bitmaptools import blit as _bitmap_blit
+except ImportError:
+    _bitmap_blit = None
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+
+def _blit(  # noqa: PLR0913, PLR0917
+    target: Bitmap,
+    source: Bitmap,
+    x: int,
+    y: int,
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+    palette_map: Optional[Sequence[int]],
+    skip_index: Optional[int],
+) -> None:
+    # Bitmaps that draw themselves, such as compressed.RLEBitmap. Checked by capability so
+    # that rendering doesn't import the compressed module. displayio.Bitmap.blit was removed
+    # in CircuitPython 9.
+    blit = getattr(source, "blit", None)
+    if blit is not None:
+        blit(target, x, y, x1, y1, x2, y2, palette_map, skip_index)
+        return
+    if _bitmap_blit and palette_map is None:
+        if skip_index is None:
+            _bitmap_blit(target, source, x, y, x1=x1, y1=y1, x2=x2, y2=y2)
+        else:
+            _bitmap_blit(
+                target, source, x, y, x1=x1, y1=y1, x2=x2, y2=y2, skip_source_index=skip_index
+            )
+        return
+
+    width = source.width
+    for source_y in range(y1, y2):
+        row = source_y * width
+        target_y = y + source_y - y1
+        target_x = x
+        for source_x in range(x1, x2):
+            value = source[row + source_x]
+            if value != skip_index:
+                if palette_map is not None:
+                    value = palette_map[value]
+                target[target_x, target_y] = value
+            target_x += 1
+
+
+def render_text(  # noqa: PLR0913
+    font: GlyphCache,
+    text: str,
+    bitmap: Bitmap,
+    x: int,
+    y: int,
+    *,
+    palette_map: Optional[Sequence[int]] = None,
+    skip_index: Optional[int] = 0,
+    clip: Optional[Tuple[int, int, int, int]] = None,
+) -> int:
+    """Draws ``text`` into ``bitmap`` with the pen starting at ``(x, y)`` on the baseline.
+
+    All of the glyphs are loaded in one batch first. Each glyph is then copied as a
+    rectangle with ``bitmaptools.blit`` when it is available and no palette mapping is
+    needed, otherwise pixel by pixel.
+
+    :param font: The font to draw with
+    :param str text: The text to draw. Unsupported characters are skipped.
+    :param Bitmap bitmap: The bitmap to draw into
+    :param int x: The x position of the pen at the start of the text
+    :param int y: The y position of the baseline
+    :param palette_map: Maps glyph pixel values to indices in ``bitmap``, for example
+        ``(0, 3)`` draws set pixels of a one bit font with color index 3. Glyph values are
+        copied unchanged when None.
+    :param skip_index: Glyph pixel value that is left transparent. None draws every pixel,
+        including the background.
+    :param clip: ``(x1, y1, x2, y2)`` rectangle, exclusive of ``x2`` and ``y2``, outside of
+        which nothing is drawn. Defaults to the whole bitmap.
+    :return: The x position of the pen after the text
+    """
+    if clip is None:
+        clip_x1, clip_y1, clip_x2, clip_y2 = 0, 0, bitmap.width, bitmap.height
+    else:
+        clip_x1, clip_y1, clip_x2, clip_y2 = clip
+        clip_x1 = max(clip_x1, 0)
+        clip_y1 = max(clip_y1, 0)
+        clip_x2 = min(clip_x2, bitmap.width)
+        clip_y2 = min(clip_y2, bitmap.height)
+
+    if hasattr(font, "load_glyphs"):
+        font.load_glyphs(text)
+
+    for char in text:
+        glyph = font.get_glyph(ord(char))
+        if not glyph:
+            continue
+        left = x + glyph.dx
+        top = y - glyph.height - glyph.dy
+        x += glyph.shift_x
+
+        x1 = max(clip_x1 - left, 0)
+        y1 = max(clip_y1 - top, 0)
+        x2 = min(clip_x2 - left, glyph.width)
+        y2 = min(clip_y2 - top, glyph.height)
+        if x1 >= x2 or y1 >= y2:
+            continue
+        _blit(bitmap, glyph.bitmap, left + x1, top + y1, x1, y1, x2, y2, palette_map, skip_index)
+
+    return x
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.render_cache`
+====================================================
+
+Caches composed bitmaps of frequently drawn strings.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Optional, Tuple
+
+    from displayio import Bitmap
+
+    from .glyph_cache import GlyphCache
+except ImportError:
+    pass
+
+from collections import OrderedDict, namedtuple
+
+from .glyph_cache import _bitmap_bytes, _value_bits
+from .render import _blit, render_text
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+RenderedString = namedtuple("RenderedString", ("bitmap", "dx", "dy", "shift_x", "size"))
+"""A composed string. ``dx`` and ``dy`` place the bitmap relative to the pen position and
+baseline the same way as a Glyph, ``shift_x`` is the advance of the whole string and
+``size`` the estimated bytes used by the bitmap."""
+
+
+class StringCache:
+    """Least recently used cache of strings composed into bitmaps, keyed by font, text and
+    color index.
+
+    Entries are dropped when the total size would exceed ``max_bytes`` and whenever the
+    font evicts a glyph that a cached string uses (see `GlyphCache.evict`).
+
+    :param int max_bytes: The budget for all cached bitmaps
+    :param bitmap_class: The class used for the composed bitmaps. Defaults to
+        displayio.Bitmap.
+    """
+
+    def __init__(self, max_bytes: int = 4096, bitmap_class: Optional[Bitmap] = None) -> None:
+        if not bitmap_class:
+            import displayio
+
+            bitmap_class = displayio.Bitmap
+        self.bitmap_class = bitmap_class
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._fonts = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, font: GlyphCache, text: str, color_index: int = 1) -> RenderedString:
+        """Returns the composed bitmap of ``text``, drawing it on a miss. Set pixels use
+        ``color_index`` and the rest 0. Pixels of fonts with several bits per pixel, such as
+        antialiased LVGL fonts, use ``color_index + value - 1``."""
+        key = (font, text, color_index)
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            entry = self._compose(font, text, color_index)
+            if entry.size > self.max_bytes:
+                return entry
+            self._reserve(entry.size)
+            if font not in self._fonts and hasattr(font, "add_eviction_listener"):
+                font.add_eviction_listener(self._glyph_evicted)
+                self._fonts.append(font)
+            self.size += entry.size
+        # Reinsert so that the entry becomes the most recently used.
+        self._entries[key] = entry
+        return entry
+
+    def blit(  # noqa: PLR0913, PLR0917
+        self,
+        bitmap: Bitmap,
+        font: GlyphCache,
+        text: str,
+        x: int,
+        y: int,
+        color_index: int = 1,
+    ) -> int:
+        """Draws ``text`` into ``bitmap`` from the cache with the pen at ``(x, y)`` on the
+        baseline. Background pixels are left transparent. Returns the x position of the pen
+        after the text."""
+        entry = self.get(font, text, color_index)
+        source = entry.bitmap
+        left = x + entry.dx
+        top = y - source.height - entry.dy
+        x1 = max(-left, 0)
+        y1 = max(-top, 0)
+        x2 = min(bitmap.width - left, source.width)
+        y2 = min(bitmap.height - top, source.height)
+        if x1 < x2 and y1 < y2:
+            _blit(bitmap, source, left + x1, top + y1, x1, y1, x2, y2, None, 0)
+        return x + entry.shift_x
+
+    def invalidate(self, font: Optional[GlyphCache] = None) -> None:
+        """Drops every cached string, or only those drawn with ``font``."""
+        for key in list(self._entries):
+            if font is None or key[0] is font:
+                self.size -= self._entries.pop(key).size
+        fonts = self._fonts if font is None else [font]
+        for cached_font in fonts[:]:
+            if cached_font in self._fonts:
+                cached_font.remove_eviction_listener(self._glyph_evicted)
+                self._fonts.remove(cached_font)
+
+    def _reserve(self, size: int) -> None:
+        while self._entries and self.size + size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self.size -= self._entries.pop(oldest).size
+
+    def _glyph_evicted(self, font: GlyphCache, code_point: int) -> None:
+        char = chr(code_point)
+        for key in list(self._entries):
+            if key[0] is font and char in key[1]:
+                self.size -= self._entries.pop(key).size
+
+    def _compose(self, font: GlyphCache, text: str, color_index: int) -> RenderedString:
+        font.load_glyphs(text)
+        left, right, bottom, top = self._bounds(font, text)
+        width = max(right - left, 1)
+        height = max(top - bottom, 1)
+        # Fonts with more than one bit per pixel keep their values above color_index
+        bits = 1
+        bits_per_value = getattr(font, "_bits_per_value", None)
+        if bits_per_value:
+            for char in text:
+                bits = max(bits, bits_per_value(ord(char)))
+        max_value = (1 << bits) - 1
+        value_count = color_index + max_value
+        bitmap = self.bitmap_class(width, height, max(value_count, 2))
+        palette_map = None
+        if color_index != 1:
+            palette_map = [0] + list(range(color_index, value_count))
+        shift_x = render_text(font, text, bitmap, -left, top, palette_map=palette_map)
+        return RenderedString(
+            bitmap,
+            left,
+            bottom,
+            shift_x + left,
+            _bitmap_bytes(width, height, _value_bits(max(value_count, 2))),
+        )
+
+    @staticmethod
+    def _bounds(font: GlyphCache, text: str) -> Tuple[int, int, int, int]:
+        x = 0
+        left = right = bottom = top = 0
+        for char in text:
+            glyph = font.get_glyph(ord(char))
+            if not glyph:
+                continue
+            left = min(left, x + glyph.dx)
+            right = max(right, x + glyph.dx + glyph.width)
+            bottom = min(bottom, glyph.dy)
+            top = max(top, glyph.dy + glyph.height)
+            x += glyph.shift_x
+        return left, right, bottom, top
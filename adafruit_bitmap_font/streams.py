@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.streams`
+====================================================
+
+File-like objects that the font loaders read from.
+
+Fonts loaded by `adafruit_bitmap_font.bitmap_font.load_font` from a file are read through
+a `BlockReader`, which can be reached as the ``file`` attribute of the font to check its
+statistics.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from io import FileIO
+    from typing import Tuple, Union
+except ImportError:
+    pass
+
+import struct
+import sys
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+# Microcontrollers read a filesystem sector at a time and have little memory to spare,
+# computers read a page at a time.
+if sys.implementation.name in {"circuitpython", "micropython"}:
+    BLOCK_SIZE = 512
+    BLOCK_COUNT = 2
+else:
+    BLOCK_SIZE = 4096
+    BLOCK_COUNT = 4
+
+
+class BufferFile:
+    """A read only file over a font held in memory, such as one downloaded into a
+    bytearray or embedded as ``bytes`` in a frozen module.
+
+    Loaders that know about it read straight from ``buffer``: PCF unpacks numbers in place
+    with `unpack` and BDF scans the lines of a ``bytes`` or ``bytearray`` buffer, or of a
+    memoryview of one on CPython, without copying them. Other loaders copy only what they
+    `readinto` their own buffers.
+
+    :param buffer: The contents of the font file
+    """
+
+    # Not a native stream, so bitmaptools can't read from it directly
+    native = False
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview]) -> None:
+        self.buffer = buffer
+        self._view = memoryview(buffer)
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to ``size`` bytes, or to the end of the buffer when ``size`` is
+        negative"""
+        start = self.position
+        end = len(self._view) if size < 0 else min(start + size, len(self._view))
+        self.position = max(end, start)
+        return bytes(self._view[start:end])
+
+    def readinto(self, buffer: bytearray) -> int:
+        """Reads into ``buffer`` and returns the number of bytes read"""
+        start = self.position
+        end = min(start + len(buffer), len(self._view))
+        count = max(end - start, 0)
+        buffer[:count] = self._view[start:end]
+        self.position += count
+        return count
+
+    def unpack(self, format_: str) -> Tuple:
+        """Unpacks ``format_`` from the current position without copying and moves past it"""
+        values = struct.unpack_from(format_, self._view, self.position)
+        self.position += struct.calcsize(format_)
+        return values
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Moves to ``offset`` relative to the start, current position or end of the buffer"""
+        if whence == 1:
+            offset += self.position
+        elif whence == 2:
+            offset += len(self._view)
+        self.position = max(offset, 0)
+        return self.position
+
+    def tell(self) -> int:
+        """The current position in the buffer"""
+        return self.position
+
+    def close(self) -> None:
+        """Drops the reference to the buffer"""
+        self.buffer = b""
+        self._view = memoryview(self.buffer)
+
+
+class BlockReader:
+    """Reads a file in aligned blocks and serves small reads from the blocks in memory.
+
+    Loaders make many small reads at nearby offsets, such as metrics, encodings and
+    bitmap offsets of a PCF font or bit packed glyph data of an LVGL font. Each of those is
+    a call into the filesystem when made on the file itself. Up to ``block_count`` blocks
+    are kept, dropping the least recently used one. Reads of a whole block or more bypass
+    the blocks.
+
+    `hits` and `misses` count the block lookups that were served from memory and that
+    had to read the file.
+
+    :param file: The file to read, opened in binary mode
+    :param block_size: The size and alignment of the blocks. Defaults to `BLOCK_SIZE`,
+        512 bytes on CircuitPython and 4096 elsewhere.
+    :param block_count: The number of blocks to keep. Defaults to `BLOCK_COUNT`.
+    """
+
+    # Not a native stream, so bitmaptools can't read from it directly. Use ``raw`` instead.
+    native = False
+
+    def __init__(
+        self,
+        file: FileIO,
+        block_size: int = BLOCK_SIZE,
+        block_count: int = BLOCK_COUNT,
+    ) -> None:
+        if block_size < 1 or block_count < 1:
+            raise ValueError("block_size and block_count must be positive")
+        self.raw = file
+        self.block_size = block_size
+        self.block_count = block_count
+        self.position = file.tell()
+        # Start and contents of each kept block, most recently used last
+        self._starts = []
+        self._blocks = []
+        self.hits = 0
+        self.misses = 0
+
+    def _block(self, start: int) -> bytes:
+        starts = self._starts
+        for i, block_start in enumerate(starts):
+            if block_start == start:
+                self.hits += 1
+                block = self._blocks[i]
+                if i != len(starts) - 1:
+                    starts.append(starts.pop(i))
+                    self._blocks.append(self._blocks.pop(i))
+                return block
+        self.misses += 1
+        if len(starts) >= self.block_count:
+            starts.pop(0)
+            self._blocks.pop(0)
+        self.raw.seek(start)
+        block = self.raw.read(self.block_size)
+        starts.append(start)
+        self._blocks.append(block)
+        return block
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to ``size`` bytes, or to the end of the file when ``size`` is negative"""
+        if size < 0 or size >= self.block_size:
+            self.raw.seek(self.position)
+            data = self.raw.read(size)
+            self.position += len(data)
+            return data
+        position = self.position
+        offset = position % self.block_size
+        block = self._block(position - offset)
+        data = block[offset : offset + size]
+        if len(data) < size and len(block) == self.block_size:
+            # The read crosses into the next block
+            data += self._block(position - offset + self.block_size)[: size - len(data)]
+        self.position += len(data)
+        return data
+
+    def readinto(self, buffer: bytearray) -> int:
+        """Reads into ``buffer`` and returns the number of bytes read"""
+        if len(buffer) >= self.block_size:
+            self.raw.seek(self.position)
+            count = self.raw.readinto(buffer) or 0
+            self.position += count
+            return count
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def unpack(self, format_: str) -> Tuple:
+        """Unpacks ``format_`` from the current position and moves past it"""
+        size = struct.calcsize(format_)
+        offset = self.position % self.block_size
+        if offset + size <= self.block_size:
+            block = self._block(self.position - offset)
+            if offset + size <= len(block):
+                self.position += size
+                return struct.unpack_from(format_, block, offset)
+        return struct.unpack(format_, self.read(size))
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Moves to ``offset`` relative to the start, current position or end of the file"""
+        if whence == 1:
+            offset += self.position
+        elif whence == 2:
+            self.raw.seek(0, 2)
+            offset += self.raw.tell()
+        self.position = max(offset, 0)
+        return self.position
+
+    def tell(self) -> int:
+        """The current position in the file"""
+        return self.position
+
+    def reset_stats(self) -> None:
+        """Sets `hits` and `misses` back to 0"""
+        self.hits = 0
+        self.misses = 0
+
+    def close(self) -> None:
+        """Drops the blocks and closes the file"""
+        self._starts = []
+        self._blocks = []
+        self.raw.close()
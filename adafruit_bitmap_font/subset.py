@@ -0,0 +1,400 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.subset`
+====================================================
+
+Writes a copy of a font that contains only the given code points. This is meant to be run
+on a host computer to shrink fonts before copying them to a board:
+
+.. code-block:: shell
+
+    python -m adafruit_bitmap_font.subset fonts/forkawesome-42.pcf icons.pcf \\
+        --codepoints 0xf120,0xf2db,0xf3e2
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* Python 3 on the host and the dependencies in requirements.txt
+
+"""
+
+try:
+    from io import FileIO
+    from typing import Dict, Iterable, List, Optional, Union
+
+    from fontio import Glyph
+
+    from .glyph_cache import GlyphCache
+except ImportError:
+    pass
+
+import struct
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+_PCF_PROPERTIES = 1 << 0
+_PCF_ACCELERATORS = 1 << 1
+_PCF_METRICS = 1 << 2
+_PCF_BITMAPS = 1 << 3
+_PCF_BDF_ENCODINGS = 1 << 5
+_PCF_SWIDTHS = 1 << 6
+_PCF_GLYPH_NAMES = 1 << 7
+_PCF_BDF_ACCELERATORS = 1 << 8
+
+# Big endian and most significant bit first. The row padding bits of the tables other than
+# the bitmaps are unused, so they are left at 0 (1 byte).
+_PCF_FORMAT = 0xC
+# The same with bitmap rows padded to 4 bytes, the padding of displayio.Bitmap
+_PCF_BITMAP_FORMAT = 0xE
+_PCF_COMPRESSED_METRICS = 0x100
+
+
+def _code_point_list(code_points: Union[int, str, Iterable[Union[int, str]]]) -> List[int]:
+    if isinstance(code_points, int):
+        return [code_points]
+    result = set()
+    for item in code_points:
+        if isinstance(item, str):
+            result.update(ord(c) for c in item)
+        else:
+            result.add(item)
+    return sorted(result)
+
+
+def subset(
+    font: GlyphCache, code_points: Union[int, str, Iterable[Union[int, str]]]
+) -> Dict[int, Glyph]:
+    """Loads the given code points from ``font`` and returns the supported ones as a dict
+    of code point to Glyph. ``code_points`` may mix integers and strings."""
+    code_points = _code_point_list(code_points)
+    font.load_glyphs(code_points)
+    glyphs = {}
+    for code_point in code_points:
+        glyph = font.get_glyph(code_point)
+        if glyph:
+            glyphs[code_point] = glyph
+    return glyphs
+
+
+def _rows(
+    glyph: Glyph, pad: int, threshold: int, msb_first: bool = True, swap_unit: int = 1
+) -> bytes:
+    """The glyph's pixels packed most or least significant bit first with rows padded to
+    ``pad`` bytes, and the bytes of each ``swap_unit`` reversed"""
+    row_size = (glyph.width + 8 * pad - 1) // (8 * pad) * pad
+    data = bytearray(row_size * glyph.height)
+    bitmap = glyph.bitmap
+    i = 0
+    for y in range(glyph.height):
+        row = y * row_size
+        for x in range(glyph.width):
+            if bitmap[i] >= threshold:
+                data[row + x // 8] |= 0x80 >> (x % 8) if msb_first else 1 << (x % 8)
+            i += 1
+    if swap_unit > 1:
+        for i in range(0, len(data), swap_unit):
+            data[i : i + swap_unit] = data[i : i + swap_unit][::-1]
+    return bytes(data)
+
+
+def _glyph_name(font: GlyphCache, code_point: int, default: str) -> str:
+    """Keeps the glyph names of fonts that have them, such as PCF fonts"""
+    name = None
+    if hasattr(font, "glyph_name"):
+        name = font.glyph_name(code_point)
+    return name or default
+
+
+def _pixel_size(font: GlyphCache, ascent: int, descent: int) -> int:
+    """Keeps the PIXEL_SIZE property of fonts that have one, such as PCF fonts"""
+    pixel_size = None
+    if hasattr(font, "properties"):
+        pixel_size = font.properties.get("PIXEL_SIZE")
+    if not isinstance(pixel_size, int) or pixel_size <= 0:
+        pixel_size = max(ascent + descent, 1)
+    return pixel_size
+
+
+def _font_info(font: GlyphCache, glyphs: Dict[int, Glyph]):
+    ascent = font.ascent
+    descent = font.descent
+    if ascent is None:
+        ascent = max((g.height + g.dy for g in glyphs.values()), default=0)
+    if descent is None:
+        descent = max((-g.dy for g in glyphs.values()), default=0)
+    # LVGL fonts store the descent as a negative offset from the baseline
+    return ascent, abs(descent)
+
+
+def write_bdf(
+    font: GlyphCache,
+    code_points: Union[int, str, Iterable[Union[int, str]]],
+    file: FileIO,
+    name: Optional[str] = None,
+    threshold: int = 1,
+) -> int:
+    """Writes the given code points of ``font`` to ``file`` (opened in binary mode) as a BDF
+    font. Pixels with a value of at least ``threshold`` are set. Returns the number of
+    glyphs written."""
+    glyphs = subset(font, code_points)
+    ascent, descent = _font_info(font, glyphs)
+    pixel_size = _pixel_size(font, ascent, descent)
+    x_offset = min((g.dx for g in glyphs.values()), default=0)
+    y_offset = min((g.dy for g in glyphs.values()), default=0)
+    width = max((g.dx + g.width for g in glyphs.values()), default=0) - x_offset
+    height = max((g.dy + g.height for g in glyphs.values()), default=0) - y_offset
+    if name is None:
+        name = f"-Adafruit-Subset-Medium-R-Normal--{pixel_size}-{pixel_size * 10}-75-75-P-0-"
+        name += "ISO10646-1"
+
+    lines = [
+        "STARTFONT 2.1",
+        "FONT " + name,
+        f"SIZE {pixel_size} 75 75",
+        f"FONTBOUNDINGBOX {width} {height} {x_offset} {y_offset}",
+        "STARTPROPERTIES 2",
+        f"FONT_ASCENT {ascent}",
+        f"FONT_DESCENT {descent}",
+        "ENDPROPERTIES",
+        f"CHARS {len(glyphs)}",
+    ]
+    for code_point, glyph in glyphs.items():
+        row_size = (glyph.width + 7) // 8
+        data = _rows(glyph, 1, threshold)
+        lines.extend(
+            (
+                "STARTCHAR " + _glyph_name(font, code_point, f"U+{code_point:04X}"),
+                f"ENCODING {code_point}",
+                f"SWIDTH {glyph.shift_x * 1000 // pixel_size} 0",
+                f"DWIDTH {glyph.shift_x} {glyph.shift_y}",
+                f"BBX {glyph.width} {glyph.height} {glyph.dx} {glyph.dy}",
+                "BITMAP",
+            )
+        )
+        for y in range(glyph.height):
+            lines.append(data[y * row_size : (y + 1) * row_size].hex().upper())
+        lines.append("ENDCHAR")
+    lines.append("ENDFONT")
+    file.write(("\n".join(lines) + "\n").encode("utf-8"))
+    return len(glyphs)
+
+
+def _pcf_metrics(glyph: Glyph) -> tuple:
+    return (
+        glyph.dx,
+        glyph.dx + glyph.width,
+        glyph.shift_x,
+        glyph.height + glyph.dy,
+        -glyph.dy,
+    )
+
+
+def _pcf_string_table(strings: List[bytes]):
+    offsets = []
+    data = bytearray()
+    for string in strings:
+        offsets.append(len(data))
+        data += string + b"\x00"
+    return offsets, bytes(data)
+
+
+def _pad4(data: bytes) -> bytes:
+    return data + bytes(-len(data) % 4)
+
+
+def write_pcf(
+    font: GlyphCache,
+    code_points: Union[int, str, Iterable[Union[int, str]]],
+    file: FileIO,
+    threshold: int = 1,
+    bitmap_format: int = _PCF_BITMAP_FORMAT,
+) -> int:
+    """Writes the given code points of ``font`` to ``file`` (opened in binary mode) as a PCF
+    font with an encoding table that only spans the written code points. Pixels with a
+    value of at least ``threshold`` are set. Returns the number of glyphs written.
+
+    ``bitmap_format`` is the format of the bitmap table: the row padding (0 to 3 for 1 to 8
+    bytes) in bits 0 and 1, most significant byte first in bit 2, most significant bit
+    first in bit 3 and the scan unit (0 to 2 for 1 to 4 bytes) in bits 4 and 5. The default
+    of 0xE is the one that bitmaptools can read directly."""
+    pad = 1 << (bitmap_format & 3)
+    msb_first = bool(bitmap_format & 8)
+    swap_unit = 1
+    if bool(bitmap_format & 4) != msb_first:
+        swap_unit = 1 << ((bitmap_format >> 4) & 3)
+    if bitmap_format & ~0x3F or swap_unit > min(pad, 4):
+        raise ValueError(f"Unsupported bitmap format 0x{bitmap_format:X}")
+    bitmap_order = ">" if bitmap_format & 4 else "<"
+    glyphs = subset(font, code_points)
+    if not glyphs:
+        raise ValueError("None of the code points are in the font")
+    if max(glyphs) > 0xFFFF:
+        raise ValueError("PCF fonts only hold code points up to 0xFFFF")
+    ascent, descent = _font_info(font, glyphs)
+    pixel_size = _pixel_size(font, ascent, descent)
+    code_points = sorted(glyphs)
+    metrics = [_pcf_metrics(glyphs[c]) for c in code_points]
+
+    # Properties
+    names, name_data = _pcf_string_table([b"FONT_ASCENT", b"FONT_DESCENT", b"PIXEL_SIZE"])
+    properties = struct.pack(">I", 3)
+    for offset, value in zip(names, (ascent, descent, pixel_size)):
+        properties += struct.pack(">IBi", offset, 0, value)
+    properties = _pad4(properties) + struct.pack(">I", len(name_data)) + name_data
+
+    # Accelerators
+    minbounds = [min(m[i] for m in metrics) for i in range(5)]
+    maxbounds = [max(m[i] for m in metrics) for i in range(5)]
+    constant_width = int(minbounds[2] == maxbounds[2])
+    constant_metrics = int(constant_width and minbounds == maxbounds)
+    accelerators = struct.pack(
+        ">BBBBBBBBiii",
+        int(maxbounds[1] <= minbounds[2]),
+        constant_metrics,
+        int(constant_metrics and minbounds[0] >= 0),
+        constant_width,
+        int(maxbounds[3] <= ascent and maxbounds[4] <= descent),
+        0,
+        0,
+        0,
+        ascent,
+        descent,
+        max(m[1] - m[2] for m in metrics),
+    )
+    accelerators += struct.pack(">5hH", *minbounds, 0) + struct.pack(">5hH", *maxbounds, 0)
+
+    # Metrics
+    compressed = all(-128 <= v < 128 for m in metrics for v in m)
+    if compressed:
+        metrics_data = struct.pack(">h", len(metrics))
+        for m in metrics:
+            metrics_data += bytes(v + 0x80 for v in m)
+    else:
+        metrics_data = struct.pack(">i", len(metrics))
+        for m in metrics:
+            metrics_data += struct.pack(">5hH", *m, 0)
+
+    # Bitmaps, with the sizes for every row padding so other tools can repad them
+    rows = []
+    offsets = []
+    size = 0
+    for code_point in code_points:
+        offsets.append(size)
+        data = _rows(glyphs[code_point], pad, threshold, msb_first, swap_unit)
+        rows.append(data)
+        size += len(data)
+    bitmap_sizes = [
+        sum(glyphs[c].height * ((glyphs[c].width + 8 * p - 1) // (8 * p) * p) for c in code_points)
+        for p in (1, 2, 4, 8)
+    ]
+    bitmaps = struct.pack(bitmap_order + "I", len(code_points))
+    bitmaps += struct.pack(f"{bitmap_order}{len(offsets)}I", *offsets)
+    bitmaps += struct.pack(bitmap_order + "4I", *bitmap_sizes) + b"".join(rows)
+
+    # Encodings, dense between the lowest and highest byte of the code points
+    min_byte1 = min(c >> 8 for c in code_points)
+    max_byte1 = max(c >> 8 for c in code_points)
+    min_byte2 = min(c & 0xFF for c in code_points)
+    max_byte2 = max(c & 0xFF for c in code_points)
+    columns = max_byte2 - min_byte2 + 1
+    indices = [0xFFFF] * (columns * (max_byte1 - min_byte1 + 1))
+    for glyph_index, code_point in enumerate(code_points):
+        row = (code_point >> 8) - min_byte1
+        indices[row * columns + (code_point & 0xFF) - min_byte2] = glyph_index
+    encodings = struct.pack(">5h", min_byte2, max_byte2, min_byte1, max_byte1, 0)
+    encodings += struct.pack(f">{len(indices)}H", *indices)
+
+    # Scalable widths and glyph names
+    swidths = struct.pack(">I", len(code_points))
+    swidths += struct.pack(
+        f">{len(code_points)}i",
+        *(glyphs[c].shift_x * 1000 // pixel_size for c in code_points),
+    )
+    name_offsets, name_data = _pcf_string_table(
+        [_glyph_name(font, c, f"uni{c:04X}").encode("utf-8") for c in code_points]
+    )
+    glyph_names = struct.pack(">I", len(code_points))
+    glyph_names += struct.pack(f">{len(name_offsets)}I", *name_offsets)
+    glyph_names += struct.pack(">I", len(name_data)) + name_data
+
+    tables = (
+        (_PCF_PROPERTIES, _PCF_FORMAT, properties),
+        (_PCF_ACCELERATORS, _PCF_FORMAT, accelerators),
+        (_PCF_METRICS, _PCF_FORMAT | (_PCF_COMPRESSED_METRICS if compressed else 0), metrics_data),
+        (_PCF_BITMAPS, bitmap_format, bitmaps),
+        (_PCF_BDF_ENCODINGS, _PCF_FORMAT, encodings),
+        (_PCF_SWIDTHS, _PCF_FORMAT, swidths),
+        (_PCF_GLYPH_NAMES, _PCF_FORMAT, glyph_names),
+        (_PCF_BDF_ACCELERATORS, _PCF_FORMAT, accelerators),
+    )
+    offset = 8 + 16 * len(tables)
+    header = b"\x01fcp" + struct.pack("<I", len(tables))
+    body = []
+    for type_, format_, table in tables:
+        data = _pad4(struct.pack("<I", format_) + table)
+        header += struct.pack("<IIII", type_, format_, len(data), offset)
+        body.append(data)
+        offset += len(data)
+    file.write(header)
+    for data in body:
+        file.write(data)
+    return len(glyphs)
+
+
+def _parse_code_points(spec: str) -> List[int]:
+    result = []
+    for part in spec.split(","):
+        item = part.strip()
+        if not item:
+            continue
+        if "-" in item:
+            first, last = item.split("-")
+            result.extend(range(int(first, 0), int(last, 0) + 1))
+        else:
+            result.append(int(item, 0))
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point, see the module documentation"""
+    import argparse
+
+    from . import bitmap_font
+
+    parser = argparse.ArgumentParser(description="Writes a font with only the given glyphs.")
+    parser.add_argument("input", help="font to read")
+    parser.add_argument("output", help="font to write, .bdf or .pcf")
+    parser.add_argument("--text", action="append", default=[], help="characters to keep")
+    parser.add_argument(
+        "--codepoints",
+        action="append",
+        default=[],
+        help="code points to keep, such as 0x20-0x7e,0xf120",
+    )
+    args = parser.parse_args(argv)
+
+    code_points = list(args.text)
+    for spec in args.codepoints:
+        code_points.extend(_parse_code_points(spec))
+
+    font = bitmap_font.load_font(args.input)
+    with open(args.output, "wb") as output:
+        if args.output.endswith(".bdf"):
+            count = write_bdf(font, code_points, output)
+        else:
+            count = write_pcf(font, code_points, output)
+    print(f"Wrote {count} glyphs to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_bitmap_font.threadsafe`
+====================================================
+
+Shares one glyph cache between threads on CPython hosts, such as a server rendering
+previews for concurrent requests.
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+**Software and Dependencies:**
+
+* CPython, this module is not supported on CircuitPython
+
+"""
+
+try:
+    from typing import Callable, Iterable, List, Optional, Tuple, Union
+
+    from displayio import Bitmap
+    from fontio import Glyph
+except ImportError:
+    pass
+
+import threading
+
+from .glyph_cache import _ABSENT, BitmapPool, CodePointRanges, GlyphCache, _to_code_points
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Bitmap_Font.git"
+
+
+class ThreadSafeFont(GlyphCache):
+    """A `GlyphCache` that may be used from several threads at once.
+
+    Loaders keep file positions and read buffers in the font object, so each thread that
+    loads glyphs gets its own loader, and with it its own file handle, from ``opener``.
+    Loaded glyphs are stored in one cache shared by all threads. A code point that another
+    thread is already loading is waited for instead of being loaded twice.
+
+    :param opener: Called with no arguments to open a new loader, for example
+        ``lambda: bitmap_font.load_font("font.pcf")``. See `from_file`.
+    :param int max_workers: When set, `load_glyphs` calls with at least ``parallel_threshold``
+        code points are split between a ``concurrent.futures.ThreadPoolExecutor`` of this
+        many threads.
+    :param int parallel_threshold: The smallest number of code points to split between
+        workers
+    """
+
+    def __init__(
+        self,
+        opener: Callable[[], GlyphCache],
+        max_workers: Optional[int] = None,
+        parallel_threshold: int = 64,
+    ) -> None:
+        super().__init__()
+        self._opener = opener
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        # Code point to threading.Event for loads in progress
+        self._pending = {}
+        # Opens the loader of this thread now, so that a bad font fails here
+        self._loader()
+        self.parallel_threshold = parallel_threshold
+        self._executor = None
+        if max_workers:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._max_workers = max_workers
+
+    @classmethod
+    def from_file(
+        cls, filename: str, bitmap: Optional[Bitmap] = None, **kwargs
+    ) -> "ThreadSafeFont":
+        """Opens ``filename`` with `bitmap_font.load_font` once per thread."""
+        from . import bitmap_font
+
+        return cls(lambda: bitmap_font.load_font(filename, bitmap), **kwargs)
+
+    @property
+    def ascent(self) -> int:
+        """The number of pixels above the baseline of a typical ascender"""
+        return self._loader().ascent
+
+    @property
+    def descent(self) -> int:
+        """The number of pixels below the baseline of a typical descender"""
+        return self._loader().descent
+
+    def get_bounding_box(self) -> Tuple[int, int, int, int]:
+        """Return the maximum glyph size as a 4-tuple of: width, height, x_offset, y_offset"""
+        return self._loader().get_bounding_box()
+
+    @property
+    def bitmap_pool(self) -> None:
+        """Always None. `BitmapPool` is not thread safe, so it can't be shared between the
+        loaders of the threads."""
+        return None
+
+    @bitmap_pool.setter
+    def bitmap_pool(self, pool: Optional[BitmapPool]) -> None:  # noqa: PLR6301
+        if pool is not None:
+            raise TypeError("ThreadSafeFont does not support bitmap pools")
+
+    def reserve_bitmaps(self, code_points: Union[int, str, Iterable[int]]) -> None:  # noqa: PLR6301
+        raise TypeError("ThreadSafeFont does not support bitmap pools")
+
+    def _bits_per_value(self, code_point: int) -> int:
+        return self._loader()._bits_per_value(code_point)
+
+    def _read_coverage(self) -> CodePointRanges:
+        # The loader of the calling thread, since another thread may be loading with its own
+        return self._loader().coverage()
+
+    def close(self) -> None:
+        """Shuts down the worker threads, if any"""
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _loader(self) -> GlyphCache:
+        loader = getattr(self._local, "loader", None)
+        if loader is None:
+            loader = self._local.loader = self._opener()
+        return loader
+
+    def _claim(self, code_points: Iterable[int]) -> Tuple[List[int], List[threading.Event]]:
+        """Marks the code points that no thread has loaded or is loading as in progress.
+        Returns them and the events of the loads to wait for."""
+        claimed = []
+        waits = []
+        with self._lock:
+            for code_point in code_points:
+                if code_point in self._glyphs:
+                    continue
+                event = self._pending.get(code_point)
+                if event is None:
+                    self._pending[code_point] = threading.Event()
+                    claimed.append(code_point)
+                elif event not in waits:
+                    waits.append(event)
+        return claimed, waits
+
+    def _load_shard(self, code_points: List[int]) -> None:
+        loader = self._loader()
+        try:
+            loader.load_glyphs(code_points)
+        except MemoryError:
+            loader._discard(code_points)
+            raise
+        with self._lock:
+            for code_point in code_points:
+                self._glyphs[code_point] = loader._glyphs.pop(code_point, None)
+                self._metrics.pop(code_point, None)
+
+    def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        code_points = _to_code_points(code_points)
+
+        claimed, waits = self._claim(code_points)
+        try:
+            if self._executor and len(claimed) >= self.parallel_threshold:
+                shards = [claimed[i :: self._max_workers] for i in range(self._max_workers)]
+                for future in [self._executor.submit(self._load_shard, s) for s in shards]:
+                    future.result()
+            elif claimed:
+                self._load_shard(claimed)
+        finally:
+            with self._lock:
+                for code_point in claimed:
+                    self._pending.pop(code_point).set()
+        for event in waits:
+            event.wait()
+
+    def load_metrics(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        loader = self._loader()
+        loader.load_metrics(code_points)
+        with self._lock:
+            for code_point, glyph in loader._metrics.items():
+                if self._metrics.get(code_point, None) is None:
+                    self._metrics[code_point] = glyph
+            loader._metrics.clear()
+
+    def get_metrics(self, code_point: int) -> Glyph:
+        # The caches are only read under the lock, since MetricsStore and CodePointMap
+        # update entries in several steps
+        with self._lock:
+            glyph = self._glyphs.get(code_point)
+            if glyph is not None:
+                return glyph
+            loaded = code_point in self._metrics
+        if not loaded:
+            self.load_metrics((code_point,))
+        with self._lock:
+            glyph = self._glyphs.get(code_point)
+            if glyph is None:
+                glyph = self._metrics.setdefault(code_point, None)
+        return glyph
+
+    def advance(self, code_point: int) -> Optional[int]:
+        with self._lock:
+            glyph = self._glyphs.get(code_point)
+            if glyph is not None:
+                return glyph.shift_x
+            advance = self._metrics.advance(code_point, _ABSENT)
+        if advance is _ABSENT:
+            glyph = self.get_metrics(code_point)
+            return glyph.shift_x if glyph else None
+        return advance
+
+    def get_glyph(self, code_point: int) -> Glyph:
+        with self._lock:
+            glyph = self._glyphs.get(code_point, _ABSENT)
+        if glyph is _ABSENT:
+            self.load_glyphs((code_point,))
+            with self._lock:
+                glyph = self._glyphs.get(code_point)
+        return glyph
+
+    def use_code_point_map(self) -> None:
+        with self._lock:
+            super().use_code_point_map()
+
+    def evict(self, code_points: Union[int, str, Iterable[int]]) -> None:
+        with self._lock:
+            super().evict(code_points)
+
+    def _discard(self, code_points: List[int]) -> None:
+        with self._lock:
+            super()._discard(code_points)
@@ -13,6 +13,7 @@ import board
 import displayio
 
 from adafruit_bitmap_font import bitmap_font
+from adafruit_bitmap_font.render import render_text
 
 # use built in display (MagTag, PyPortal, PyGamer, PyBadge, CLUE, etc.)
 # see guide for setting up external displays (TFT / OLED breakouts, RGB matrices, etc.)
@@ -34,33 +35,9 @@ palette = displayio.Palette(2)
 palette[0] = 0x000000
 palette[1] = 0xFFFFFF
 
+# draw the text with its baseline just above the lowest descender
 _, height, _, dy = font.get_bounding_box()
-for y in range(height):
-    pixels = []
-    for c in "Adafruit CircuitPython":
-        glyph = font.get_glyph(ord(c))
-        if not glyph:
-            continue
-        glyph_y = y + (glyph.height - (height + dy)) + glyph.dy
-
-        if 0 <= glyph_y < glyph.height:
-            for i in range(glyph.width):
-                value = glyph.bitmap[i, glyph_y]
-                pixel = 0
-                if value > 0:
-                    pixel = 1
-                pixels.append(pixel)
-        else:
-            # empty section for this glyph
-            for i in range(glyph.width):
-                pixels.append(0)
-
-        # one space between glyph
-        pixels.append(0)
-
-    if pixels:
-        for x, pixel in enumerate(pixels):
-            bitmap[x, y] = pixel
+render_text(font, "Adafruit CircuitPython", bitmap, 0, height + dy)
 
 # Create a TileGrid to hold the bitmap
 tile_grid = displayio.TileGrid(bitmap, pixel_shader=palette)
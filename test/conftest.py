@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+
+import displayio
+import pytest
+
+from adafruit_bitmap_font import bitmap_font
+
+FONTS = os.path.join(os.path.dirname(__file__), "..", "examples", "fonts")
+
+
+@pytest.fixture
+def font_path():
+    """Returns the path of one of the example fonts"""
+
+    def path(name):
+        return os.path.join(FONTS, name)
+
+    return path
+
+
+@pytest.fixture
+def load_font(font_path):
+    """Loads one of the example fonts or the font at an absolute path, with displayio.Bitmap
+    glyphs by default. Fonts given as contents or file objects are passed on as they are."""
+
+    def load(name, bitmap_class=displayio.Bitmap):
+        if isinstance(name, str):
+            name = font_path(name)
+        return bitmap_font.load_font(name, bitmap_class)
+
+    return load
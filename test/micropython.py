@@ -0,0 +1,9 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""Implementation of minimal micropython subset for testing"""
+
+
+def const(value):
+    return value
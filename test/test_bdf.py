@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+
+def test_async_load_survives_interleaved_get_glyph(load_font):
+    reference = load_font("LeagueSpartan-Bold-16.bdf")
+    font = load_font("LeagueSpartan-Bold-16.bdf")
+    code_points = list(range(0x20, 0x250))
+    reference.load_glyphs(code_points)
+
+    async def interrupt():
+        # Moves the shared reader to the end of the font while the load is suspended
+        for code_point in (0x24F, 0x21, 0x1F0, 0x41):
+            font.get_glyph(code_point)
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(font.load_glyphs_async(code_points, chunk_size=1), interrupt())
+
+    asyncio.run(main())
+    for code_point in code_points:
+        expected = reference.get_glyph(code_point)
+        glyph = font.get_glyph(code_point)
+        assert (glyph is None) == (expected is None), hex(code_point)
+        if glyph is not None:
+            assert glyph[2:] == expected[2:]
+            assert bytes(glyph.bitmap.values) == bytes(expected.bitmap.values)
+            assert code_point not in font._missing
+
+
+def _assert_same_glyphs(font, reference, code_points):
+    font.load_glyphs(code_points)
+    reference.load_glyphs(code_points)
+    for code_point in code_points:
+        glyph = font.get_glyph(code_point)
+        expected = reference.get_glyph(code_point)
+        assert (glyph is None) == (expected is None), hex(code_point)
+        if glyph is not None:
+            assert glyph[2:] == expected[2:], hex(code_point)
+            assert bytes(glyph.bitmap.values) == bytes(expected.bitmap.values), hex(code_point)
+
+
+def test_file_lines_share_one_buffer(load_font, font_path):
+    reference = load_font("LeagueSpartan-Bold-16.bdf")
+    code_points = list(range(0x20, 0x100))
+    with open(font_path("LeagueSpartan-Bold-16.bdf"), "rb") as file:
+        data = file.read()
+    # Held in memory as bytes, the font is its own block
+    font = load_font(data)
+    assert font._reader.block is data
+    _assert_same_glyphs(font, reference, code_points)
+
+    font = load_font("LeagueSpartan-Bold-16.bdf")
+    block = font._reader.block
+    assert isinstance(block, bytearray)
+    _assert_same_glyphs(font, reference, code_points)
+    assert font._reader.block is block
+
+
+def test_line_longer_than_block(load_font, font_path, tmp_path):
+    reference = load_font("LeagueSpartan-Bold-16.bdf")
+    with open(font_path("LeagueSpartan-Bold-16.bdf"), "rb") as file:
+        data = file.read()
+    header_end = data.index(b"\n") + 1
+    path = tmp_path / "long.bdf"
+    path.write_bytes(data[:header_end] + b"COMMENT " + b"x" * 3000 + b"\n" + data[header_end:])
+    _assert_same_glyphs(load_font(str(path)), reference, list(range(0x20, 0x80)))
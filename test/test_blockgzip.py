@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import gzip
+import io
+import sys
+import types
+
+import pytest
+
+from adafruit_bitmap_font import blockgzip
+from adafruit_bitmap_font.streams import BlockReader
+
+FONTS = ("Junction-regular-24.pcf", "LeagueSpartan-Bold-16.bdf")
+
+
+def _read(font_path, name):
+    with open(font_path(name), "rb") as file:
+        return file.read()
+
+
+def _assert_same_glyphs(font, reference):
+    code_points = list(range(0x20, 0x80))
+    font.load_glyphs(code_points)
+    reference.load_glyphs(code_points)
+    for code_point in code_points:
+        glyph = font.get_glyph(code_point)
+        expected = reference.get_glyph(code_point)
+        assert (glyph is None) == (expected is None), hex(code_point)
+        if glyph is not None:
+            assert glyph[2:] == expected[2:], hex(code_point)
+            assert bytes(glyph.bitmap.values) == bytes(expected.bitmap.values)
+
+
+def _block_gzip(data):
+    compressed = io.BytesIO()
+    blockgzip.compress(io.BytesIO(data), compressed, 1024)
+    return compressed.getvalue()
+
+
+def _plain_gzip(data):
+    return gzip.compress(data)
+
+
+def _multi_member_gzip(data):
+    middle = len(data) // 3
+    return gzip.compress(data[:middle]) + gzip.compress(data[middle:])
+
+
+@pytest.mark.parametrize("name", FONTS)
+@pytest.mark.parametrize("compressor", (_block_gzip, _plain_gzip, _multi_member_gzip))
+def test_gzip_font(load_font, font_path, tmp_path, name, compressor):
+    data = _read(font_path, name)
+    path = tmp_path / (name + ".gz")
+    path.write_bytes(compressor(data))
+    font = load_font(str(path))
+    assert isinstance(font.file, blockgzip.BlockGzipFile)
+    assert (font.file._stream is None) == (compressor is _block_gzip)
+    _assert_same_glyphs(font, load_font(name))
+    font.file.seek(0)
+    assert font.file.read() == data
+
+
+def test_deflate_reads_native_file(load_font, font_path, tmp_path, monkeypatch):
+    """CircuitPython has no zlib.decompressobj, only deflate.DeflateIO"""
+    streams = []
+
+    class DeflateIO:
+        def __init__(self, stream, _format):
+            streams.append(stream)
+            self._file = gzip.GzipFile(fileobj=stream)
+
+        def read(self, size):
+            return self._file.read(size)
+
+    monkeypatch.setattr(blockgzip, "zlib", types.SimpleNamespace(decompress=None))
+    monkeypatch.setitem(sys.modules, "deflate", types.SimpleNamespace(DeflateIO=DeflateIO, GZIP=2))
+    name = "Junction-regular-24.pcf"
+    path = tmp_path / (name + ".gz")
+    path.write_bytes(_plain_gzip(_read(font_path, name)))
+    font = load_font(str(path))
+    assert streams
+    assert not any(isinstance(stream, BlockReader) for stream in streams)
+    _assert_same_glyphs(font, load_font(name))
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import os
+import subprocess
+import sys
+
+import displayio
+
+from adafruit_bitmap_font.compressed import CompressedFont
+from adafruit_bitmap_font.render import render_text
+
+
+def _render(font, text):
+    target = displayio.Bitmap(200, 40, 2)
+    end = render_text(font, text, target, 2, 30)
+    return end, bytes(target.values)
+
+
+def test_repeated_characters(load_font):
+    text = "Hello, World!"
+    font = CompressedFont(load_font("Junction-regular-24.pcf"))
+    assert _render(font, text) == _render(load_font("Junction-regular-24.pcf"), text)
+    for char in text:
+        assert font.get_glyph(ord(char)) is not None
+
+
+def test_render_does_not_import_compressed():
+    # The shims for displayio and fontio live next to the tests
+    code = (
+        "import sys; import adafruit_bitmap_font.render; "
+        "assert 'adafruit_bitmap_font.compressed' not in sys.modules"
+    )
+    tests = os.path.dirname(__file__)
+    path = os.pathsep.join((tests, os.path.join(tests, "..")))
+    subprocess.run([sys.executable, "-c", code], check=True, env=dict(os.environ, PYTHONPATH=path))
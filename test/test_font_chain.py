@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_bitmap_font.font_chain import FontChain
+
+
+def _count_calls(font, method):
+    calls = []
+    wrapped = getattr(font, method)
+
+    def count(code_points):
+        calls.append(list(code_points))
+        return wrapped(code_points)
+
+    setattr(font, method, count)
+    return calls
+
+
+def test_load_metrics_batches_each_font(load_font):
+    latin = load_font("LeagueSpartan-Bold-16.bdf")
+    cjk = load_font("unifont-16.0.02-ja.bin")
+    chain = FontChain([latin, cjk], baseline_offsets=(0, 2))
+    latin_calls = _count_calls(latin, "load_metrics")
+    cjk_calls = _count_calls(cjk, "load_metrics")
+
+    chain.load_metrics("Hi日本H")
+    assert latin_calls == [[ord("H"), ord("i")]]
+    assert cjk_calls == [[ord("日"), ord("本")]]
+    assert chain.get_metrics(ord("i"))[2:] == latin.get_metrics(ord("i"))[2:]
+    metrics = chain.get_metrics(ord("日"))
+    assert metrics.dy == cjk.get_metrics(ord("日")).dy + 2
+    assert chain.measure("Hi日") == sum(chain.advance(ord(c)) for c in "Hi日")
+
+    chain.load_metrics("Hi")
+    assert len(latin_calls) == 1
+
+
+def test_missing_glyph_is_not_loaded_again(load_font):
+    latin = load_font("LeagueSpartan-Bold-16.bdf")
+    chain = FontChain([latin])
+    calls = _count_calls(latin, "load_glyphs")
+    groups = _count_calls(chain, "_group")
+    assert chain.get_glyph(0x10FFFF) is None
+    assert chain.get_glyph(0x10FFFF) is None
+    assert chain.get_glyph(ord("A")) is not None
+    assert chain.get_glyph(ord("A")) is not None
+    assert calls == [[ord("A")]]
+    assert groups == [[0x10FFFF], [ord("A")]]
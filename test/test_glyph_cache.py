@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+
+from adafruit_bitmap_font.font_chain import FontChain
+from adafruit_bitmap_font.glyph_cache import BitmapPool
+
+
+def test_font_chain_bitmap_pool(load_font):
+    latin = load_font("Junction-regular-24.pcf")
+    cjk = load_font("unifont-16.0.02-ja.bin")
+    chain = FontChain([latin, cjk])
+    chain.bitmap_pool = pool = BitmapPool()
+    assert latin.bitmap_pool is pool and cjk.bitmap_pool is pool
+
+    chain.reserve_bitmaps("Hi日本")
+    assert len(pool) == 4
+    chain.load_glyphs("Hi日本")
+    assert (pool.hits, pool.misses, len(pool)) == (4, 0, 0)
+    chain.evict("Hi日本")
+    assert len(pool) == 4
+
+
+def test_advance_reads_metrics(load_font):
+    font = load_font("LeagueSpartan-Bold-16.bdf")
+    font.load_metrics("Hi")
+    assert font.advance(ord("H")) == font.get_metrics(ord("H")).shift_x
+    assert font.advance(0x10FFFF) is None
+    assert font.measure("HiH") == 2 * font.advance(ord("H")) + font.advance(ord("i"))
+
+
+def test_load_glyphs_within_rolls_back_quietly(load_font):
+    allocations = []
+
+    def bitmap_class(width, height, value_count):
+        if len(allocations) == 3:
+            raise MemoryError
+        allocations.append(width)
+        return displayio.Bitmap(width, height, value_count)
+
+    font = load_font("LeagueSpartan-Bold-16.bdf", bitmap_class)
+    font.bitmap_pool = pool = BitmapPool()
+    evicted = []
+    font.add_eviction_listener(lambda font, code_point: evicted.append(code_point))
+    try:
+        font.load_glyphs_within("Hello", 1 << 20)
+    except MemoryError:
+        pass
+    else:
+        raise AssertionError("MemoryError not raised")
+    assert len(allocations) == 3
+    assert not evicted
+    assert len(pool) == 0
+    assert all(font._glyphs.get(ord(c)) is None for c in "Hello")
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from fontio import Glyph
+
+from adafruit_bitmap_font.layout import Layout
+
+
+class _Font:
+    """Every character is 10 pixels wide, except ``i`` which is 5"""
+
+    fixed_advance = None
+
+    @staticmethod
+    def get_bounding_box():
+        return (10, 12, 0, -2)
+
+    @staticmethod
+    def get_glyph(code_point):
+        advance = 5 if code_point == ord("i") else 10
+        return Glyph(None, 0, advance, 10, 0, 0, advance, 0)
+
+
+def _lines(layout):
+    return [layout.text[start:end] for start, end in layout.lines]
+
+
+def test_wrap_after_spaces():
+    layout = Layout(_Font(), 75, "aaa bbb ccc iiii")
+    assert _lines(layout) == ["aaa bbb ", "ccc iiii"]
+    assert layout.position(4) == (40, 0)
+    assert layout.position(8) == (0, 12)
+    assert layout.position(12) == (40, 12)
+    assert layout.position(15) == (55, 12)
+    assert layout.height == 24
+
+
+def test_explicit_newlines():
+    layout = Layout(_Font(), 1000, "ab\n\ncd\n")
+    assert _lines(layout) == ["ab", "", "cd", ""]
+    assert list(layout.glyph_positions()) == [(0, 0, 0), (1, 10, 0), (4, 0, 24), (5, 10, 24)]
+    assert list(layout.glyph_positions(2, 2)) == [(4, 0, 24), (5, 10, 24)]
+
+
+def test_word_wider_than_box():
+    layout = Layout(_Font(), 35, "ab abcdefgh")
+    assert _lines(layout) == ["ab ", "abc", "def", "gh"]
+    assert [layout.position(i)[0] for i in range(3, 11)] == [0, 10, 20, 0, 10, 20, 0, 10]
+
+
+def test_box_narrower_than_a_character():
+    layout = Layout(_Font(), 5, "abc")
+    assert _lines(layout) == ["a", "b", "c"]
+
+
+def test_trailing_spaces_past_position_range():
+    text = "a" + " " * 5000 + "\nb"
+    layout = Layout(_Font(), 100, text)
+    assert _lines(layout) == ["a" + " " * 5000, "b"]
+    assert layout.position(1) == (10, 0)
+    assert layout.position(5000) == (32767, 0)
+    assert layout.position(len(text) - 1) == (0, 12)
+
+
+def test_edits_match_a_fresh_layout():
+    layout = Layout(_Font(), 75)
+    for text in ("aaa bbb", "aaa bbb ccc iiii", "aaa bb ccc iiii", "aaa\nbb ccc", "x"):
+        layout.text = text
+        fresh = Layout(_Font(), 75, text)
+        assert layout.lines == fresh.lines
+        assert [layout.position(i) for i in range(len(text))] == [
+            fresh.position(i) for i in range(len(text))
+        ]
+
+
+def test_font_metrics_only(load_font):
+    font = load_font("LeagueSpartan-Bold-16.bdf")
+    layout = Layout(font, 60, "Hello World")
+    assert _lines(layout) == ["Hello ", "World"]
+    assert layout.position(1) == (font.advance(ord("H")), 0)
+    # Only the metrics are loaded, never the bitmaps
+    assert not any(font._glyphs.values())
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import struct
+
+import displayio
+import pytest
+from fontio import Glyph
+
+from adafruit_bitmap_font.glyph_cache import GlyphCache
+from adafruit_bitmap_font.subset import write_pcf
+
+_PCF_BITMAPS = 1 << 3
+_PCF_BDF_ENCODINGS = 1 << 5
+
+
+class _TerminalFont(GlyphCache):
+    """8x8 glyphs that all have the same metrics, with a different pattern each"""
+
+    ascent = 7
+    descent = 1
+
+    def load_glyphs(self, code_points):
+        for code_point in code_points:
+            bitmap = displayio.Bitmap(8, 8, 2)
+            for i in range(64):
+                bitmap[i] = (i * code_point) % 5 == 0
+            self._glyphs[code_point] = Glyph(bitmap, 0, 8, 8, 0, -1, 8, 0)
+
+
+def _write_pcf(font, code_points, path):
+    with open(path, "wb") as file:
+        write_pcf(font, code_points, file)
+    with open(path, "rb") as file:
+        return bytearray(file.read())
+
+
+def _assert_same_glyphs(font, reference, code_points):
+    for code_point in code_points:
+        glyph = font.get_glyph(code_point)
+        expected = reference.get_glyph(code_point)
+        assert glyph[2:] == expected[2:], hex(code_point)
+        assert bytes(glyph.bitmap.values) == bytes(expected.bitmap.values), hex(code_point)
+
+
+def test_unencoded_glyph_name(tmp_path, font_path, load_font):
+    path = font_path("Junction-regular-24.pcf")
+    font = load_font("Junction-regular-24.pcf")
+    assert font.code_point_for_name("0041") == ord("A")
+    # Remove "A" from the encoding table, leaving its glyph and name in the font. The table
+    # of this font starts at code point 0.
+    entry = font.tables[_PCF_BDF_ENCODINGS].offset + 14 + 2 * ord("A")
+    order = font._byte_order(_PCF_BDF_ENCODINGS)
+    with open(path, "rb") as file:
+        data = bytearray(file.read())
+    struct.pack_into(order + "H", data, entry, 0xFFFF)
+    unencoded = tmp_path / "unencoded.pcf"
+    unencoded.write_bytes(data)
+
+    font = load_font(str(unencoded))
+    assert font.code_point_for_name("0041") is None
+    assert font.code_point_for_name("0042") == ord("B")
+
+
+def test_bitmaps_out_of_glyph_order(tmp_path, load_font):
+    source = _TerminalFont()
+    code_points = list(range(0x41, 0x49))
+    path = tmp_path / "terminal.pcf"
+    data = _write_pcf(source, code_points, path)
+    font = load_font(str(path))
+    assert font._bitmap_stride == 32
+    _assert_same_glyphs(font, source, code_points)
+
+    # Swap the bitmaps of two glyphs in the middle, and their offsets
+    offsets = font.tables[_PCF_BITMAPS].offset + 8
+    bitmaps = offsets + 4 * len(code_points) + 16
+    struct.pack_into(">2I", data, offsets + 4 * 3, 4 * 32, 3 * 32)
+    third = data[bitmaps + 3 * 32 : bitmaps + 4 * 32]
+    data[bitmaps + 3 * 32 : bitmaps + 4 * 32] = data[bitmaps + 4 * 32 : bitmaps + 5 * 32]
+    data[bitmaps + 4 * 32 : bitmaps + 5 * 32] = third
+    path.write_bytes(data)
+    font = load_font(str(path))
+    assert font._bitmap_stride is None
+    _assert_same_glyphs(font, source, code_points)
+
+
+# Every row padding, byte order and bit order, with each scan unit that fits in the rows
+_BITMAP_FORMATS = [
+    pad | byte | bit | unit << 4
+    for pad in range(4)
+    for byte in (0, 4)
+    for bit in (0, 8)
+    for unit in range(3)
+    if unit <= pad and (unit == 0 or bool(byte) != bool(bit))
+]
+
+
+@pytest.mark.parametrize("bitmap_format", _BITMAP_FORMATS, ids=hex)
+def test_bitmap_formats(tmp_path, load_font, bitmap_format):
+    source = load_font("Junction-regular-24.pcf")
+    text = "Hello, World! @#$%&Qgjy"
+    path = tmp_path / "format.pcf"
+    with open(path, "wb") as file:
+        write_pcf(source, text, file, bitmap_format=bitmap_format)
+    font = load_font(str(path))
+    assert font.tables[_PCF_BITMAPS].format == bitmap_format
+    _assert_same_glyphs(font, source, sorted(set(map(ord, text))))
@@ -0,0 +1,88 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+from fontio import Glyph
+
+from adafruit_bitmap_font.glyph_cache import GlyphCache
+from adafruit_bitmap_font.render import render_text
+
+
+class _TwoBitFont(GlyphCache):
+    """3x2 glyphs of 2 bits per pixel, offset from the pen and baseline"""
+
+    def load_glyphs(self, code_points):
+        for code_point in map(ord, code_points) if isinstance(code_points, str) else code_points:
+            bitmap = displayio.Bitmap(3, 2, 4)
+            for i in range(6):
+                bitmap[i] = (i + code_point) % 4
+            self._glyphs[code_point] = Glyph(bitmap, 0, 3, 2, 1, -1, 5, 0)
+
+    def _bits_per_value(self, code_point):  # noqa: PLR6301
+        return 2
+
+
+def _expected(font, text, size, origin, palette_map=None):
+    """Draws the text pixel by pixel from the glyph metrics"""
+    width, height = size
+    x, y = origin
+    expected = [[0] * width for _ in range(height)]
+    for char in text:
+        glyph = font.get_glyph(ord(char))
+        if not glyph:
+            continue
+        top = y - glyph.height - glyph.dy
+        for glyph_y in range(glyph.height):
+            for glyph_x in range(glyph.width):
+                value = glyph.bitmap[glyph_x, glyph_y]
+                target_x = x + glyph.dx + glyph_x
+                target_y = top + glyph_y
+                if value and 0 <= target_x < width and 0 <= target_y < height:
+                    expected[target_y][target_x] = palette_map[value] if palette_map else value
+        x += glyph.shift_x
+    return expected, x
+
+
+def _pixels(bitmap):
+    return [[bitmap[x, y] for x in range(bitmap.width)] for y in range(bitmap.height)]
+
+
+def test_glyphs_on_the_baseline(load_font):
+    font = load_font("Junction-regular-24.pcf")
+    text = "Hig, qy!"
+    target = displayio.Bitmap(120, 40, 2)
+    end = render_text(font, text, target, 3, 28)
+    expected, expected_end = _expected(font, text, (120, 40), (3, 28))
+    assert end == expected_end == 3 + sum(font.get_glyph(ord(c)).shift_x for c in text)
+    assert _pixels(target) == expected
+    assert any(target[x, 28] for x in range(120))
+
+
+def test_multi_bit_font():
+    font = _TwoBitFont()
+    target = displayio.Bitmap(16, 6, 8)
+    end = render_text(font, "abc", target, 0, 4, palette_map=(0, 5, 6, 7))
+    expected, expected_end = _expected(font, "abc", (16, 6), (0, 4), (0, 5, 6, 7))
+    assert end == expected_end == 15
+    assert _pixels(target) == expected
+    # The first glyph starts one pixel right of the pen, with its bottom one below the baseline
+    assert target[1, 3] == 5
+    assert target[1, 4] == 0
+
+
+def test_clip_and_background():
+    font = _TwoBitFont()
+    target = displayio.Bitmap(16, 6, 4)
+    for i in range(len(target)):
+        target[i] = 1
+    render_text(font, "ab", target, 0, 4, skip_index=None, clip=(2, 3, 7, 4))
+    expected = [[1] * 16 for _ in range(6)]
+    first = font.get_glyph(ord("a")).bitmap
+    second = font.get_glyph(ord("b")).bitmap
+    # Only the top row of each glyph box inside the clip is drawn, background
+    # pixels included since skip_index is None
+    expected[3][2] = first[1, 0]
+    expected[3][3] = first[2, 0]
+    expected[3][6] = second[0, 0]
+    assert _pixels(target) == expected
@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+from fontio import Glyph
+
+from adafruit_bitmap_font.glyph_cache import GlyphCache
+from adafruit_bitmap_font.render_cache import StringCache
+
+
+class _TwoBitFont(GlyphCache):
+    """Glyphs of 2 bits per pixel holding every value from 0 to 3"""
+
+    def load_glyphs(self, code_points):
+        for code_point in map(ord, code_points) if isinstance(code_points, str) else code_points:
+            bitmap = displayio.Bitmap(4, 1, 4)
+            for x in range(4):
+                bitmap[x, 0] = x
+            self._glyphs[code_point] = Glyph(bitmap, 0, 4, 1, 0, 0, 4, 0)
+
+    def _bits_per_value(self, code_point):  # noqa: PLR6301
+        return 2
+
+
+def test_multi_bit_font():
+    cache = StringCache()
+    for color_index in (1, 5):
+        entry = cache.get(_TwoBitFont(), "ab", color_index)
+        expected = [0] + [color_index + value - 1 for value in (1, 2, 3)]
+        assert [entry.bitmap[x, 0] for x in range(8)] == expected * 2
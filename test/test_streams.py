@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_bitmap_font.streams import BufferFile
+
+
+@pytest.mark.parametrize("kind", (bytes, bytearray, memoryview))
+def test_buffer_file(kind):
+    file = BufferFile(kind(b"0123456789"))
+    assert file.read(3) == b"012"
+    assert file.unpack("2B") == (ord("3"), ord("4"))
+    buffer = bytearray(4)
+    assert file.readinto(buffer) == 4
+    assert buffer == b"5678"
+    assert file.seek(-2, 2) == 8
+    assert file.read() == b"89"
+    assert file.read(5) == b""
+
+
+@pytest.mark.parametrize("kind", (bytes, bytearray, memoryview))
+def test_bdf_lines_read_in_place(load_font, font_path, kind):
+    with open(font_path("LeagueSpartan-Bold-16.bdf"), "rb") as file:
+        data = file.read()
+    reference = load_font("LeagueSpartan-Bold-16.bdf")
+    source = kind(data)
+    font = load_font(source)
+    # The loader scans the memory of the source instead of copying it a block at a time
+    block = font._reader.block
+    assert block is (source.obj if kind is memoryview else source)
+
+    code_points = list(range(0x20, 0x80))
+    font.load_glyphs(code_points)
+    reference.load_glyphs(code_points)
+    for code_point in code_points:
+        glyph = font.get_glyph(code_point)
+        expected = reference.get_glyph(code_point)
+        assert (glyph is None) == (expected is None), hex(code_point)
+        if glyph is not None:
+            assert glyph[2:] == expected[2:], hex(code_point)
+            assert bytes(glyph.bitmap.values) == bytes(expected.bitmap.values)
+    assert font._reader.block is block
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_bitmap_font.subset import write_pcf
+
+
+def test_write_pcf_keeps_pixel_size(tmp_path, load_font):
+    font = load_font("Junction-regular-24.pcf")
+    path = tmp_path / "subset.pcf"
+    with open(path, "wb") as file:
+        assert write_pcf(font, "Hello", file) == 4
+
+    subset = load_font(str(path))
+    assert subset.properties["PIXEL_SIZE"] == font.properties["PIXEL_SIZE"]
+    for char in "Helo":
+        glyph = font.get_glyph(ord(char))
+        copy = subset.get_glyph(ord(char))
+        assert (copy.width, copy.height, copy.dx, copy.dy, copy.shift_x) == (
+            glyph.width,
+            glyph.height,
+            glyph.dx,
+            glyph.dy,
+            glyph.shift_x,
+        )
+        assert bytes(copy.bitmap) == bytes(glyph.bitmap)
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+
+from adafruit_bitmap_font.threadsafe import ThreadSafeFont
+
+
+def test_loaders_stay_on_their_thread(load_font):
+    name = "LeagueSpartan-Bold-16.bdf"
+    misused = []
+
+    def opener():
+        # A loader may only be used by the thread that opened it, since another thread may
+        # be loading glyphs with it at the same time
+        loader = load_font(name)
+        owner = threading.get_ident()
+        for method in ("coverage", "get_bounding_box", "_bits_per_value", "load_glyphs"):
+            wrapped = getattr(loader, method)
+
+            def check(*args, wrapped=wrapped):
+                if threading.get_ident() != owner:
+                    misused.append(wrapped.__name__)
+                return wrapped(*args)
+
+            setattr(loader, method, check)
+        return loader
+
+    font = ThreadSafeFont(opener)
+    reference = load_font(name)
+    results = []
+
+    def query():
+        results.append(
+            (
+                font.has_glyph(ord("A")),
+                font.has_glyph(0x10FFFF),
+                font.get_bounding_box(),
+                font.estimate_memory("AB"),
+            )
+        )
+
+    thread = threading.Thread(target=query)
+    thread.start()
+    font.load_glyphs("Hello")
+    thread.join()
+
+    assert not misused
+    assert results == [(True, False, reference.get_bounding_box(), reference.estimate_memory("AB"))]
+    assert font.get_glyph(ord("H"))[2:] == reference.get_glyph(ord("H"))[2:]